@@ -1,30 +1,112 @@
+import time
+_IMPORT_STARTED = time.perf_counter()
+
 import dash
 import os
 import uuid
 import datetime
 import math
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, ForeignKey, Boolean
+import threading
+import functools
+import collections
+import zlib
+import hashlib
+from concurrent.futures import ThreadPoolExecutor, wait as wait_futures
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+from sqlalchemy import create_engine, Column, Integer, String, DateTime, ForeignKey, Boolean, Index, LargeBinary, Float, Text, func, inspect, text
+from sqlalchemy import event as sa_event
+from sqlalchemy import insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlalchemy.schema import CreateIndex
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
 from dash import Dash, html, dcc
 from flask import Flask
 from flask import request
+from flask import g, has_request_context
 from dash.dependencies import Input, Output, State, ALL, MATCH
 from dash import callback_context
 import json
 import dash_bootstrap_components as dbc
 
-# Add for Excel export
-import pandas as pd
+# Add for Excel export (pandas/openpyxl are imported lazily inside the export job
+# so that cold starts on scale-to-zero machines don't pay for them)
 import io
 from flask import send_file
+from flask import jsonify
+from flask import Response
+from markupsafe import escape
+import base64
+import gzip
+try:
+    import brotli
+except ImportError:  # gzip only
+    brotli = None
 
 # Database setup
 DATABASE_URL = os.environ.get('DATABASE_URL')
-if DATABASE_URL and DATABASE_URL.startswith("postgres://"):
-    DATABASE_URL = DATABASE_URL.replace("postgres://", "postgresql://", 1)
-engine = create_engine(DATABASE_URL)
+# Embedded single-node mode is opt-in: DATABASE_URL=sqlite:///path, or W2M_EMBEDDED=1 for a local
+# SQLite file at SQLITE_PATH. It runs in WAL mode, which lets the gunicorn workers read concurrently
+# while one writes; the busy timeout makes a writer wait for the lock instead of failing with
+# "database is locked". A missing DATABASE_URL otherwise fails at startup rather than quietly
+# writing to a file that disappears with the machine.
+if not DATABASE_URL:
+    if os.environ.get('W2M_EMBEDDED') != '1':
+        raise RuntimeError('DATABASE_URL is not set. Set it, or set W2M_EMBEDDED=1 to use a local SQLite file (SQLITE_PATH).')
+    DATABASE_URL = f"sqlite:///{os.environ.get('SQLITE_PATH', 'when2meet.db')}"
+SQLITE_BUSY_TIMEOUT_MS = int(os.environ.get('SQLITE_BUSY_TIMEOUT_MS', '5000'))
+
+def _make_engine(url):
+    if url.startswith("postgres://"):
+        url = url.replace("postgres://", "postgresql://", 1)
+    if not url.startswith('sqlite'):
+        return create_engine(url)
+    sqlite_engine = create_engine(url, connect_args={'timeout': SQLITE_BUSY_TIMEOUT_MS / 1000, 'check_same_thread': False})
+
+    @sa_event.listens_for(sqlite_engine, 'connect')
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('PRAGMA synchronous=NORMAL')
+        cursor.execute(f'PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}')
+        cursor.execute('PRAGMA foreign_keys=ON')
+        cursor.close()
+    return sqlite_engine
+
+engine = _make_engine(DATABASE_URL)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# Optional read replica. Read-only callbacks and routes open ReadSession(), which goes to the
+# replica unless this client wrote within READ_YOUR_WRITES_SECONDS (tracked by a cookie, so it
+# holds across gunicorn workers) or the current request already wrote. Writes always use SessionLocal.
+DATABASE_REPLICA_URL = os.environ.get('DATABASE_REPLICA_URL')
+READ_YOUR_WRITES_SECONDS = int(os.environ.get('READ_YOUR_WRITES_SECONDS', '30'))
+PRIMARY_STICKY_COOKIE = 'w2m_primary_until'
+replica_engine = _make_engine(DATABASE_REPLICA_URL) if DATABASE_REPLICA_URL else None
+ReplicaSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=replica_engine) if replica_engine is not None else None
+
+def _reads_from_primary():
+    # Anything outside a request (startup, archival) reads from the primary; jobs use _job_read_session
+    if not has_request_context():
+        return True
+    if getattr(g, 'w2m_primary_until', None):
+        return True
+    try:
+        return float(request.cookies.get(PRIMARY_STICKY_COOKIE, 0)) > time.time()
+    except ValueError:
+        return False
+
+def ReadSession():
+    if ReplicaSessionLocal is None or _reads_from_primary():
+        return SessionLocal()
+    return ReplicaSessionLocal()
+
+def mark_primary_sticky():
+    # Called after a write; the cookie is set on the response in _after_request
+    if has_request_context():
+        g.w2m_primary_until = time.time() + READ_YOUR_WRITES_SECONDS
 Base = declarative_base()
 
 # Models
@@ -38,6 +120,10 @@ class When2MeetEvent(Base):
     end_date = Column(DateTime, nullable=False)
     start_time = Column(String, nullable=False)  # e.g., '09:00'
     end_time = Column(String, nullable=False)    # e.g., '18:00'
+    # Bumped on every availability save; in-memory aggregates are valid for one version
+    availability_version = Column(Integer, nullable=False, default=0, server_default='0')
+    # Set once the event's availability has been moved into when2meet_event_archives
+    archived_at = Column(DateTime, nullable=True)
     # Add more fields as needed
 
 class When2MeetAvailability(Base):
@@ -48,15 +134,250 @@ class When2MeetAvailability(Base):
     time_slot = Column(String, nullable=False)  # e.g., '2024-07-11T09:00'
     available = Column(Boolean, default=True)
     event = relationship('When2MeetEvent', backref='availabilities')
+    __table_args__ = (
+        # Serves the per-slot GROUP BY used by the grid and the single-slot name lookups
+        Index('ix_when2meet_availability_event_slot', 'event_id', 'time_slot'),
+        # Serves the cross-event free/busy lookup for one participant
+        Index('ix_when2meet_availability_user_event', 'user_name', 'event_id'),
+        # One row per participant per slot, whatever order concurrent saves land in
+        Index('uq_when2meet_availability_slot', 'event_id', 'user_name', 'time_slot', unique=True),
+    )
+
+# Compact read-only copy of an expired event's availability: one row per event holding a
+# zlib-compressed JSON map of user -> slot bitmask over the event geometry (see archive_event)
+class When2MeetEventArchive(Base):
+    __tablename__ = 'when2meet_event_archives'
+    event_id = Column(Integer, ForeignKey('when2meet_events.id'), primary_key=True)
+    archived_at = Column(DateTime, nullable=False)
+    participants = Column(Integer, nullable=False)
+    slot_count = Column(Integer, nullable=False)  # availability rows folded into the payload
+    payload = Column(LargeBinary, nullable=False)
+
+# Who took part in an archived event, so per-participant lookups (free/busy) only open their own archives
+class When2MeetArchiveParticipant(Base):
+    __tablename__ = 'when2meet_event_archive_participants'
+    event_id = Column(Integer, ForeignKey('when2meet_event_archives.event_id'), primary_key=True)
+    user_name = Column(String, primary_key=True)
+    __table_args__ = (
+        Index('ix_when2meet_archive_participants_user_event', 'user_name', 'event_id'),
+    )
+
+# Background jobs (exports, admin summaries). The row is the queue entry, the progress report and
+# the cached result, so a poll can be answered by any gunicorn worker, not just the one running it.
+class When2MeetJob(Base):
+    __tablename__ = 'when2meet_jobs'
+    id = Column(String, primary_key=True)
+    kind = Column(String, nullable=False)       # key into _job_handlers
+    cache_key = Column(String, nullable=False)  # jobs with the same key share one result
+    params = Column(Text, nullable=False)       # JSON
+    status = Column(String, nullable=False)     # queued, running, done, failed
+    progress = Column(Float, nullable=False, default=0)
+    result = Column(LargeBinary, nullable=True)
+    error = Column(String, nullable=True)
+    created_at = Column(DateTime, nullable=False)
+    finished_at = Column(DateTime, nullable=True)
+    __table_args__ = (
+        # At most one live (not failed) job per key, so concurrent submits from any worker share it
+        Index('uq_when2meet_jobs_active_key', 'cache_key', unique=True,
+              postgresql_where=text("status <> 'failed'"), sqlite_where=text("status <> 'failed'")),
+    )
 
-# Create tables if they don't exist
-Base.metadata.create_all(bind=engine)
+# Create tables if they don't exist. This runs in a background thread at startup
+# (together with warming the connection pool) instead of at import time, and
+# ensure_schema() is also called before the first request in case that thread
+# hasn't finished yet.
+_schema_lock = threading.Lock()
+_schema_ready = threading.Event()
+# Arbitrary app-wide key for the Postgres advisory lock that serializes migrations
+_SCHEMA_LOCK_KEY = 7525001
+
+def _lock_schema(conn):
+    # _schema_lock only covers one process; this makes the gunicorn workers migrate one at a time.
+    # Both hold until the migration transaction commits.
+    if conn.dialect.name == 'postgresql':
+        conn.execute(text('SELECT pg_advisory_xact_lock(:key)'), {'key': _SCHEMA_LOCK_KEY})
+    elif conn.dialect.name == 'sqlite':
+        # BEGIN IMMEDIATE gives up after the busy timeout; a long migration elsewhere just means waiting longer
+        while True:
+            try:
+                conn.exec_driver_sql('BEGIN IMMEDIATE')
+                return
+            except OperationalError as e:
+                conn.rollback()
+                if 'locked' not in str(e):
+                    raise
+
+def _add_missing_columns(conn):
+    inspector = inspect(conn)
+    for table in Base.metadata.sorted_tables:
+        existing = {c['name'] for c in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing:
+                continue
+            ddl = f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column.type.compile(engine.dialect)}'
+            if column.server_default is not None:
+                ddl += f' NOT NULL DEFAULT {column.server_default.arg}'
+            conn.execute(text(ddl))
+
+def _remove_duplicate_availability(conn):
+    # Rows written before the unique index existed may repeat a (event, user, slot); keep the oldest
+    conn.execute(text(
+        'DELETE FROM when2meet_availability WHERE id NOT IN '
+        '(SELECT MIN(id) FROM when2meet_availability GROUP BY event_id, user_name, time_slot)'
+    ))
+
+def _backfill_archive_participants(conn):
+    # Archives written before the participant table existed
+    rows = [
+        {'event_id': event_id, 'user_name': user_name}
+        for event_id, payload in conn.execute(select(When2MeetEventArchive.event_id, When2MeetEventArchive.payload))
+        for user_name in json.loads(zlib.decompress(payload))['users']
+    ]
+    if rows:
+        conn.execute(insert(When2MeetArchiveParticipant), rows)
+
+def ensure_schema():
+    if _schema_ready.is_set():
+        return
+    with _schema_lock:
+        if not _schema_ready.is_set():
+            # One transaction under the cross-process lock; every step checks what the previous
+            # holder already did, so the workers after the first find nothing left to do
+            with engine.connect() as conn:
+                _lock_schema(conn)
+                existing_tables = set(inspect(conn).get_table_names())
+                Base.metadata.create_all(bind=conn, checkfirst=True)
+                if existing_tables and When2MeetArchiveParticipant.__tablename__ not in existing_tables:
+                    _backfill_archive_participants(conn)
+                # create_all skips columns and indexes on tables that already exist, so add any missing ones
+                _add_missing_columns(conn)
+                for table in Base.metadata.sorted_tables:
+                    existing = {ix['name'] for ix in inspect(conn).get_indexes(table.name)}
+                    for index in table.indexes:
+                        if index.name in existing:
+                            continue
+                        if index.unique and table.name == When2MeetAvailability.__tablename__:
+                            _remove_duplicate_availability(conn)
+                        conn.execute(CreateIndex(index, if_not_exists=True))
+                conn.commit()
+            _schema_ready.set()
+
+def _warm_start():
+    try:
+        ensure_schema()
+        # Open (and return) a few pooled connections so the first visitor doesn't pay for them
+        for warm_engine in (engine, replica_engine):
+            if warm_engine is None:
+                continue
+            conns = [warm_engine.connect() for _ in range(int(os.environ.get('WARM_POOL_SIZE', '2')))]
+            for conn in conns:
+                conn.close()
+    except Exception as e:
+        print(f"STARTUP: background warm-up failed: {e}")
 
 # Dash app scaffold
 server = Flask(__name__)
 app = Dash(__name__, server=server, suppress_callback_exceptions=True, external_stylesheets=[dbc.themes.BOOTSTRAP])
 app.title = '7525 When2Meet'
 
+# Startup metrics: import time and first-request latency, printed to the logs and
+# optionally appended as JSON lines to STARTUP_METRICS_FILE so they can be tracked over time
+_startup_metrics = {}
+_first_request_lock = threading.Lock()
+
+def _record_startup_metrics(**values):
+    _startup_metrics.update(values)
+    line = json.dumps({'ts': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'), 'pid': os.getpid(), **values})
+    print(f"STARTUP: {line}")
+    metrics_file = os.environ.get('STARTUP_METRICS_FILE')
+    if metrics_file:
+        try:
+            with open(metrics_file, 'a') as f:
+                f.write(line + '\n')
+        except OSError as e:
+            print(f"STARTUP: could not write metrics file: {e}")
+
+# Response encoding: JSON/HTML/JS/CSS/CSV responses (Dash layouts and callbacks, snapshots,
+# JSON routes) are brotli- or gzip-encoded per Accept-Encoding, and raw vs. sent byte counts are
+# kept per endpoint (per callback output for Dash updates) and served at /_stats/compression.
+# Dash serializes component trees through plotly's JSON encoder; its stdlib engine measured
+# faster than its orjson engine on our page trees (which has to pre-clean every dict), so pin it.
+COMPRESS_MIN_BYTES = int(os.environ.get('COMPRESS_MIN_BYTES', '500'))
+COMPRESS_GZIP_LEVEL = int(os.environ.get('COMPRESS_GZIP_LEVEL', '6'))
+COMPRESS_BROTLI_QUALITY = int(os.environ.get('COMPRESS_BROTLI_QUALITY', '5'))
+_COMPRESSIBLE_MIMETYPES = ('application/json', 'text/html', 'text/css', 'text/plain', 'text/csv', 'application/javascript', 'text/javascript')
+_compression_stats = {}
+_compression_stats_lock = threading.Lock()
+
+def _stats_key():
+    if request.path == '/_dash-update-component':
+        body = request.get_json(silent=True) or {}
+        return f"dash:{body.get('output', '?')}"
+    return request.url_rule.rule if request.url_rule is not None else request.path
+
+def _encode_response(response):
+    if response.direct_passthrough or response.is_streamed or 'Content-Encoding' in response.headers:
+        return response
+    if response.status_code < 200 or response.status_code >= 300 or response.mimetype not in _COMPRESSIBLE_MIMETYPES:
+        return response
+    data = response.get_data()
+    raw_size = len(data)
+    encoding = None
+    if raw_size >= COMPRESS_MIN_BYTES:
+        accepted = request.accept_encodings
+        if brotli is not None and accepted['br']:
+            encoding, data = 'br', brotli.compress(data, quality=COMPRESS_BROTLI_QUALITY)
+        elif accepted['gzip']:
+            encoding, data = 'gzip', gzip.compress(data, compresslevel=COMPRESS_GZIP_LEVEL)
+    if encoding:
+        response.set_data(data)
+        response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+    key = _stats_key()
+    with _compression_stats_lock:
+        stats = _compression_stats.setdefault(key, {'responses': 0, 'raw_bytes': 0, 'sent_bytes': 0})
+        stats['responses'] += 1
+        stats['raw_bytes'] += raw_size
+        stats['sent_bytes'] += len(data)
+    return response
+
+try:
+    import plotly.io.json
+    plotly.io.json.config.default_engine = 'json'
+except ImportError:
+    pass
+
+@server.route('/_stats/compression')
+def compression_stats():
+    with _compression_stats_lock:
+        stats = {key: dict(value) for key, value in _compression_stats.items()}
+    for value in stats.values():
+        value['ratio'] = round(value['sent_bytes'] / value['raw_bytes'], 3) if value['raw_bytes'] else None
+    return jsonify({'pid': os.getpid(), 'endpoints': stats})
+
+@server.before_request
+def _before_request():
+    request.environ['w2m.request_started'] = time.perf_counter()
+    ensure_schema()
+
+@server.after_request
+def _after_request(response):
+    primary_until = getattr(g, 'w2m_primary_until', None)
+    if primary_until:
+        response.set_cookie(PRIMARY_STICKY_COOKIE, f'{primary_until:.0f}', max_age=READ_YOUR_WRITES_SECONDS, httponly=True, samesite='Lax')
+    response = _encode_response(response)
+    if 'first_request_ms' not in _startup_metrics:
+        with _first_request_lock:
+            if 'first_request_ms' not in _startup_metrics:
+                now = time.perf_counter()
+                started = request.environ.get('w2m.request_started', now)
+                _record_startup_metrics(
+                    first_request_path=request.path,
+                    first_request_ms=round((now - started) * 1000, 1),
+                    boot_to_first_response_ms=round((now - _IMPORT_STARTED) * 1000, 1),
+                )
+    return response
+
 app.layout = html.Div([
     # Navbar
     html.Nav([
@@ -70,6 +391,16 @@ app.layout = html.Div([
             'color': '#fff',
             'cursor': 'pointer',
         }),
+        html.Button('My Schedule', id='freebusy-btn', style={
+            'fontSize': '14px',
+            'padding': '6px 12px',
+            'margin': '8px',
+            'borderRadius': '0px',
+            'border': '0px solid transparent',
+            'background': 'transparent',
+            'color': '#fff',
+            'cursor': 'pointer',
+        }),
         html.Button('Admin', id='admin-btn', style={
             'fontSize': '14px',
             'padding': '6px 12px',
@@ -99,7 +430,20 @@ app.layout = html.Div([
     html.Div(id='page-content')
 ], style={'backgroundColor': '#1a1a1a', 'minHeight': '100vh', 'color': '#f5f5f5'})
 
+# The homepage has no per-request content, so its component tree is built once and reused
 def serve_homepage():
+    return _build_homepage()
+
+_TIMEZONE_OPTIONS = [
+    {'label': 'America/Chicago', 'value': 'America/Chicago'},
+    {'label': 'America/New_York', 'value': 'America/New_York'},
+    {'label': 'America/Los_Angeles', 'value': 'America/Los_Angeles'},
+    {'label': 'UTC', 'value': 'UTC'},
+    # Add more as needed
+]
+
+@functools.lru_cache(maxsize=1)
+def _build_homepage():
     hour_options = [{'label': str(h), 'value': str(h)} for h in range(1, 13)]
     minute_options = [{'label': f'{m:02d}', 'value': f'{m:02d}'} for m in [0, 15, 30, 45]]
     ampm_options = [{'label': 'AM', 'value': 'AM'}, {'label': 'PM', 'value': 'PM'}]
@@ -116,13 +460,7 @@ def serve_homepage():
                 html.Label('Time Zone:'),
                 dcc.Dropdown(
                     id='timezone',
-                    options=[
-                        {'label': 'America/Chicago', 'value': 'America/Chicago'},
-                        {'label': 'America/New_York', 'value': 'America/New_York'},
-                        {'label': 'America/Los_Angeles', 'value': 'America/Los_Angeles'},
-                        {'label': 'UTC', 'value': 'UTC'},
-                        # Add more as needed
-                    ],
+                    options=_TIMEZONE_OPTIONS,
                     value='America/Chicago',
                     style={'width': '100%', 'marginBottom': '8px', 'color': 'black'}
                 ),
@@ -154,58 +492,226 @@ def serve_homepage():
             'display': 'flex', 'flexDirection': 'row', 'alignItems': 'center', 'justifyContent': 'center', 'margin': '0 auto', 'maxWidth': '700px', 'width': '100%'}),
     ])
 
+# Event slot lattice (dates x 30-minute slots). Built once per event version and memoized,
+# so the grid, header toggles, admin dashboard and export all share the same precomputed strings.
+class EventGeometry:
+    def __init__(self, start_date, end_date, start_time, end_time):
+        num_days = (end_date - start_date).days + 1
+        self.dates = [start_date + datetime.timedelta(days=i) for i in range(num_days)]
+        # Generate list of time slots (every 30 min)
+        def parse_time(tstr):
+            h, m = map(int, tstr.split(':'))
+            return datetime.time(hour=h, minute=m)
+        slots = []
+        t = datetime.datetime.combine(datetime.date.today(), parse_time(start_time))
+        end_dt = datetime.datetime.combine(datetime.date.today(), parse_time(end_time))
+        while t <= end_dt:
+            slots.append(t.time())
+            t += datetime.timedelta(minutes=30)
+        self.slots = slots
+        self.date_strs = [str(d) for d in self.dates]
+        self.slot_strs = [s.strftime('%H:%M') for s in slots]
+        self.date_index = {d: i for i, d in enumerate(self.date_strs)}
+        self.slot_index = {t: i for i, t in enumerate(self.slot_strs)}
+        # Display labels
+        self.date_labels = [(d.strftime('%a'), d.strftime('%b %d'), d.strftime('%a %b %d')) for d in self.dates]
+        self.slot_labels = [(s.strftime('%#I:%M %p'), s.strftime('%I:%M %p')) for s in slots]
+        # Keys toggled by clicking a row header (one time, every date) or a column header (one date, every time)
+        self.row_keys = {t: [(d, t) for d in self.date_strs] for t in self.slot_strs}
+        self.col_keys = {d: [(d, t) for t in self.slot_strs] for d in self.date_strs}
+        # "date time" column names used by the Excel export
+        self.columns = [f"{d} {t}" for d in self.date_strs for t in self.slot_strs]
+
+    def __len__(self):
+        return len(self.date_strs) * len(self.slot_strs)
+
+    # Bitmask over the lattice: bit (date_index * number of slots + slot_index) is set per key
+    def pack(self, keys):
+        mask = 0
+        num_slots = len(self.slot_strs)
+        for d, t in keys:
+            i = self.date_index.get(d)
+            j = self.slot_index.get(t)
+            if i is not None and j is not None:
+                mask |= 1 << (i * num_slots + j)
+        return mask
+
+    def unpack(self, mask):
+        num_slots = len(self.slot_strs)
+        keys = []
+        while mask:
+            low = mask & -mask
+            bit = low.bit_length() - 1
+            keys.append((self.date_strs[bit // num_slots], self.slot_strs[bit % num_slots]))
+            mask ^= low
+        return keys
+
+@functools.lru_cache(maxsize=512)
+def _build_event_geometry(start_date, end_date, start_time, end_time):
+    return EventGeometry(start_date, end_date, start_time, end_time)
+
+# Event URL -> geometry, so callbacks that only know the URL (header toggles) skip the DB.
+# Bounded LRU like _aggregate_cache; entries are tiny, the geometry itself lives in the lru_cache.
+GEOMETRY_URL_CACHE_SIZE = int(os.environ.get('GEOMETRY_URL_CACHE_SIZE', '2048'))
+_geometry_by_url = collections.OrderedDict()
+_geometry_by_url_lock = threading.Lock()
+
+def get_event_geometry(event):
+    geometry = _build_event_geometry(event.start_date.date(), event.end_date.date(), event.start_time, event.end_time)
+    with _geometry_by_url_lock:
+        _geometry_by_url[event.url] = geometry
+        _geometry_by_url.move_to_end(event.url)
+        while len(_geometry_by_url) > GEOMETRY_URL_CACHE_SIZE:
+            _geometry_by_url.popitem(last=False)
+    return geometry
+
+def get_event_geometry_for_url(event_url):
+    with _geometry_by_url_lock:
+        geometry = _geometry_by_url.get(event_url)
+        if geometry is not None:
+            _geometry_by_url.move_to_end(event_url)
+    if geometry is None:
+        session = ReadSession()
+        event = session.query(When2MeetEvent).filter_by(url=event_url).first()
+        session.close()
+        if not event:
+            return None
+        geometry = get_event_geometry(event)
+    return geometry
+
 def get_event_grid(event):
-    # Generate list of dates
-    start_date = event.start_date.date()
-    end_date = event.end_date.date()
-    num_days = (end_date - start_date).days + 1
-    dates = [start_date + datetime.timedelta(days=i) for i in range(num_days)]
-    # Generate list of time slots (every 30 min)
-    def parse_time(tstr):
-        h, m = map(int, tstr.split(':'))
-        return datetime.time(hour=h, minute=m)
-    start_time = parse_time(event.start_time)
-    end_time = parse_time(event.end_time)
-    slots = []
-    t = datetime.datetime.combine(datetime.date.today(), start_time)
-    end_dt = datetime.datetime.combine(datetime.date.today(), end_time)
-    while t <= end_dt:
-        slots.append(t.time())
-        t += datetime.timedelta(minutes=30)
-    return dates, slots
+    geometry = get_event_geometry(event)
+    return geometry.dates, geometry.slots
+
+# Per-slot aggregates for read-only views, computed in SQL (GROUP BY time_slot) so we
+# transfer one row per slot instead of hydrating an ORM object per (user, slot).
+_NAME_SEPARATOR = '\x1f'
+
+def _aggregate_names(column):
+    if engine.dialect.name == 'postgresql':
+        return func.array_agg(column)
+    return func.group_concat(column, _NAME_SEPARATOR)
+
+def get_slot_aggregates(event_id, with_names=False):
+    columns = [When2MeetAvailability.time_slot, func.count(When2MeetAvailability.id)]
+    if with_names:
+        columns.append(_aggregate_names(When2MeetAvailability.user_name))
+    session = ReadSession()
+    try:
+        rows = session.query(*columns).filter(When2MeetAvailability.event_id == event_id).group_by(When2MeetAvailability.time_slot).all()
+    finally:
+        session.close()
+    counts = {}
+    names = {}
+    for row in rows:
+        dt = row[0].split('T')
+        if len(dt) != 2:
+            continue
+        key = (dt[0], dt[1])
+        counts[key] = row[1]
+        if with_names:
+            slot_names = row[2] if isinstance(row[2], list) else (row[2] or '').split(_NAME_SEPARATOR)
+            names[key] = sorted(slot_names)
+    return counts, names
+
+def get_slot_names(event_id, date, time):
+    session = ReadSession()
+    try:
+        rows = session.query(When2MeetAvailability.user_name).filter(
+            When2MeetAvailability.event_id == event_id,
+            When2MeetAvailability.time_slot == f'{date}T{time}'
+        ).all()
+    finally:
+        session.close()
+    return sorted(r[0] for r in rows)
+
+# In-memory slot aggregates per event (counts and names), valid for one availability_version.
+# save_user_availability writes through to this cache, so re-rendering after a save doesn't
+# re-aggregate; other workers see the bumped version and rebuild on their next read.
+AGGREGATE_CACHE_SIZE = int(os.environ.get('AGGREGATE_CACHE_SIZE', '256'))
+_aggregate_cache = collections.OrderedDict()
+_aggregate_cache_lock = threading.Lock()
+
+def _cached_aggregates(event_id, version):
+    with _aggregate_cache_lock:
+        entry = _aggregate_cache.get(event_id)
+        if entry is None or entry[0] != version:
+            return None
+        _aggregate_cache.move_to_end(event_id)
+        return entry[1], entry[2]
+
+def _store_aggregates(event_id, version, counts, names):
+    with _aggregate_cache_lock:
+        entry = _aggregate_cache.get(event_id)
+        # Never replace a newer version with an older one
+        if entry is not None and entry[0] > version:
+            return
+        _aggregate_cache[event_id] = (version, counts, names)
+        _aggregate_cache.move_to_end(event_id)
+        while len(_aggregate_cache) > AGGREGATE_CACHE_SIZE:
+            _aggregate_cache.popitem(last=False)
+
+def get_event_aggregates(event):
+    version = event.availability_version or 0
+    cached = _cached_aggregates(event.id, version)
+    if cached is not None:
+        return cached
+    if event.archived_at is not None:
+        counts, names = archived_slot_aggregates(event)
+    else:
+        counts, names = get_slot_aggregates(event.id, with_names=True)
+    _store_aggregates(event.id, version, counts, names)
+    return counts, names
+
+def _write_through_aggregates(event_id, old_version, new_version, user_name, old_keys, new_keys):
+    cached = _cached_aggregates(event_id, old_version)
+    if cached is None:
+        return
+    counts, names = dict(cached[0]), dict(cached[1])
+    # Idempotent: the cached entry may have been read after this save committed (the version and
+    # the aggregates are read separately), so it can already reflect it
+    for key in old_keys - new_keys:
+        if user_name not in names.get(key, []):
+            continue
+        remaining = [n for n in names[key] if n != user_name]
+        if remaining:
+            counts[key], names[key] = len(remaining), remaining
+        else:
+            counts.pop(key, None)
+            names.pop(key, None)
+    for key in new_keys - old_keys:
+        if user_name in names.get(key, []):
+            continue
+        slot_names = sorted(names.get(key, []) + [user_name])
+        counts[key], names[key] = len(slot_names), slot_names
+    _store_aggregates(event_id, new_version, counts, names)
+
+def heat_color(count, max_count):
+    # Color scale: white to blue (#5A8CC8)
+    if count <= 0:
+        return '#fff'
+    return f'rgb({90 + (255-90)*(1-count/max_count):.0f},{140 + (255-140)*(1-count/max_count):.0f},{200 + (255-200)*(1-count/max_count):.0f})'
 
 def render_availability_grid(event, user_avail_set=None, signed_in=False, user_name=None):
-    session = SessionLocal()
-    availabilities = session.query(When2MeetAvailability).filter_by(event_id=event.id).all()
-    session.close()
-    dates, slots = get_event_grid(event)
-    avail_dict = {}
-    all_names = set()
-    for a in availabilities:
-        dt = a.time_slot.split('T')
-        if len(dt) == 2:
-            d, t = dt
-            avail_dict.setdefault((d, t), []).append(a.user_name)
-            all_names.add(a.user_name)
-    if user_avail_set:
-        for d, t in user_avail_set:
-            all_names.add('You')
-    all_names = sorted(all_names)
-    all_counts = [len(v) for v in avail_dict.values()] or [1]
+    counts, avail_dict = get_event_aggregates(event)
+    geometry = get_event_geometry(event)
+    all_counts = list(counts.values()) or [1]
     max_count = max(all_counts)
     grid_header = [html.Th('', style={'cursor': 'default'})] + [
         html.Th([
-            html.Div(date.strftime('%a'), style={'fontWeight': 'bold'}),
-            html.Div(date.strftime('%b %d'), style={'fontSize': '12px'})
-        ], id={'type': 'col-header', 'date': str(date)}, style={'cursor': 'pointer', 'userSelect': 'none'})
-        for date in dates
+            html.Div(day_label, style={'fontWeight': 'bold'}),
+            html.Div(month_label, style={'fontSize': '12px'})
+        ], id={'type': 'col-header', 'date': date_str}, style={'cursor': 'pointer', 'userSelect': 'none'},
+            **{'data-grid-kind': 'col', 'data-date': date_str})
+        for date_str, (day_label, month_label, _) in zip(geometry.date_strs, geometry.date_labels)
     ]
     grid_rows = []
     popovers = []
-    for slot in slots:
+    for slot_str, (slot_label, slot_popover_label) in zip(geometry.slot_strs, geometry.slot_labels):
         row = [html.Td(
-            slot.strftime('%#I:%M %p').replace('AM','AM').replace('PM','PM'),
-            id={'type': 'row-header', 'time': slot.strftime('%H:%M')},
+            slot_label,
+            id={'type': 'row-header', 'time': slot_str},
+            **{'data-grid-kind': 'row', 'data-time': slot_str},
             style={
                 'cursor': 'pointer',
                 'userSelect': 'none',
@@ -219,24 +725,19 @@ def render_availability_grid(event, user_avail_set=None, signed_in=False, user_n
                 'borderRight': '2px solid #5A8CC8',
             }
         )]
-        for date in dates:
-            key = (str(date), slot.strftime('%H:%M'))
+        for date_str, (_, _, date_popover_label) in zip(geometry.date_strs, geometry.date_labels):
+            key = (date_str, slot_str)
             available_names = avail_dict.get(key, [])
             is_user = user_avail_set and key in user_avail_set
             # Only add 'You' if the user's actual name is not already in the list
             if is_user and user_name and user_name not in available_names:
                 available_names = available_names + ['You']
             count = len(available_names)
-            # Color scale: white to blue (#5A8CC8)
-            if max_count == 1:
-                blue = 200
-            else:
-                blue = int(255 - (count / max_count) * (255 - 140))  # 140 is the blue channel of #5A8CC8
-            color = f'rgb({90 + (255-90)*(1-count/max_count):.0f},{140 + (255-140)*(1-count/max_count):.0f},{200 + (255-200)*(1-count/max_count):.0f})' if count > 0 else '#fff'
+            color = heat_color(count, max_count)
             cell_color = '#5A8CC8' if is_user else color
             border = '2px solid #1976d2' if is_user else '1px solid #ccc'
-            cell_id = {'type': 'grid-cell', 'id': f"{str(date)}-{slot.strftime('%H:%M')}"}
-            popover_id = {'type': 'popover', 'id': f"cell-{date}-{slot.strftime('%H-%M')}", 'date': str(date), 'time': slot.strftime('%H:%M')}
+            cell_id = {'type': 'grid-cell', 'id': f"{date_str}-{slot_str}"}
+            popover_id = {'type': 'popover', 'id': f"cell-{date_str}-{slot_str.replace(':', '-')}", 'date': date_str, 'time': slot_str}
             popover_content = [
                 html.Div([
                     html.B('Available: '),
@@ -255,10 +756,10 @@ def render_availability_grid(event, user_avail_set=None, signed_in=False, user_n
                 'cursor': 'pointer',
                 'transition': 'background 0.2s',
                 'position': 'relative',
-            }))
+            }, **{'data-grid-kind': 'cell', 'data-date': date_str, 'data-time': slot_str}))
             popovers.append(
                 dbc.Popover([
-                    dbc.PopoverHeader(f"{date.strftime('%a %b %d')} {slot.strftime('%I:%M %p')}", style={'fontSize': '14px'}),
+                    dbc.PopoverHeader(f"{date_popover_label} {slot_popover_label}", style={'fontSize': '14px'}),
                     dbc.PopoverBody(popover_content)
                 ],
                 id=popover_id,
@@ -276,86 +777,137 @@ def render_availability_grid(event, user_avail_set=None, signed_in=False, user_n
     # Wrap grid in a div with scroll cue class and right padding
     return html.Div([grid] + popovers, className='grid-scroll-cue', style={'overflowX': 'auto', 'maxWidth': '100vw', 'position': 'relative', 'paddingRight': '24px'})
 
+# Static fragments of the event page (sign-in form, legend, tooltip, buttons and their style
+# dicts) are built once; serve_event_page only fills in the event's own fields and grid.
+_LINK_STYLE = {
+    'marginLeft': '12px',
+    'fontWeight': 'bold',
+    'color': '#E77D2E',
+    'textDecoration': 'underline',
+    'fontSize': '15px',
+    'cursor': 'pointer'
+}
+_SHARE_INPUT_STYLE = {'width': '100%', 'marginTop': '8px', 'marginBottom': '16px', 'fontSize': '15px', 'background': '#232323', 'color': '#fff', 'border': '1px solid #5A8CC8', 'borderRadius': '4px'}
+_SNAPSHOT_LINK_STYLE = {'marginLeft': '12px', 'color': '#E77D2E', 'textDecoration': 'underline', 'fontSize': '15px', 'whiteSpace': 'nowrap'}
+_SHARE_ROW_STYLE = {'maxWidth': '600px', 'margin': '0 auto', 'marginBottom': '12px', 'display': 'flex', 'alignItems': 'center'}
+_EVENT_INFO_STYLE = {'textAlign': 'center', 'maxWidth': '600px', 'margin': '0 auto'}
+_EVENT_TITLE_STYLE = {'marginBottom': '0.5em'}
+_ARCHIVED_NOTE_STYLE = {'color': '#E77D2E'}
+_GRID_WRAPPER_STYLE = {'overflowX': 'auto', 'maxWidth': '100vw', 'position': 'relative'}
+
+@functools.lru_cache(maxsize=None)
+def _event_page_fragments():
+    return {
+        'import_upload': dcc.Upload(
+            html.A("Import from Excel/CSV", style={
+                'fontWeight': 'bold',
+                'color': '#E77D2E',
+                'textDecoration': 'underline',
+                'fontSize': '15px',
+                'cursor': 'pointer'
+            }),
+            id='import-availability-upload',
+            accept='.xlsx,.csv',
+            style={'marginLeft': '12px', 'whiteSpace': 'nowrap'}
+        ),
+        'signin_fields': [
+            html.Label('Your Name:'),
+            dcc.Input(id='event-username', type='text', placeholder='Enter your name', style={'width': '100%', 'marginBottom': '8px'}),
+            html.Label('Password (optional):'),
+            dcc.Input(id='event-password', type='password', placeholder='Optional', style={'width': '100%', 'marginBottom': '8px'}),
+            html.Button('Sign In', id='event-signin-btn', n_clicks=0, style={
+                'width': '100%', 'fontSize': '16px', 'padding': '10px', 'background': '#E77D2E', 'color': 'white', 'border': 'none', 'borderRadius': '4px', 'cursor': 'pointer', 'marginBottom': '8px'
+            }),
+            html.Div(id='event-signin-output', style={'marginTop': '8px'}),
+            dcc.Upload(
+                html.A('Fill my availability from a calendar (.ics)', style={'color': '#E77D2E', 'textDecoration': 'underline', 'cursor': 'pointer', 'fontSize': '14px'}),
+                id='ics-upload',
+                accept='.ics,text/calendar',
+                style={'marginTop': '8px', 'textAlign': 'center'}
+            )
+        ],
+        'grid_heading': [
+            html.H3("Group's Availability", style={'textAlign': 'center', 'marginBottom': '8px'}),
+            html.Div([
+                html.Span('1/14 Available', style={'fontSize': '12px', 'marginRight': '8px'}),
+                html.Div(style={'display': 'inline-block', 'width': '80px', 'height': '16px', 'background': 'linear-gradient(to right, #fff, #5A8CC8)', 'verticalAlign': 'middle', 'marginRight': '8px'}),
+                html.Span('14/14 Available', style={'fontSize': '12px'})
+            ], style={'textAlign': 'center', 'marginBottom': '4px'}),
+            html.Div('Mouseover or click a cell to see who is available', style={'textAlign': 'center', 'fontSize': '12px', 'marginBottom': '8px'}),
+            # Written by assets/grid_events.js with just the clicked/hovered cell coordinates
+            dcc.Store(id='grid-click-store'),
+            dcc.Store(id='grid-hover-store'),
+        ],
+        'tooltip': html.Div(id='grid-tooltip', style={
+            'display': 'none',
+            'position': 'fixed',
+            'zIndex': 9999,
+            'background': 'white',
+            'border': '1px solid #1976d2',
+            'borderRadius': '6px',
+            'padding': '8px',
+            'boxShadow': '0 2px 8px rgba(0,0,0,0.15)',
+            'fontSize': '13px',
+            'pointerEvents': 'none',
+            'minWidth': '180px',
+            'maxWidth': '260px',
+            'color': '#222',
+        }),
+        'grid_message': html.Div(id='grid-message', style={'textAlign': 'center', 'color': '#d32f2f', 'marginTop': '8px'}),
+        'not_found': html.Div([
+            html.H2('Event Not Found'),
+            html.P('Sorry, this event does not exist.')
+        ]),
+    }
+
+@functools.lru_cache(maxsize=None)
+def _event_signin_section(archived):
+    return html.Div(_event_page_fragments()['signin_fields'], style={'maxWidth': '350px', 'margin': '0 auto', 'marginBottom': '24px', 'display': 'none' if archived else 'block'})
+
+@functools.lru_cache(maxsize=None)
+def _save_availability_button(signed_in):
+    return html.Button('Save My Availability', id='save-availability-btn', n_clicks=0, style={
+        'marginTop': '16px', 'width': '100%', 'fontSize': '16px', 'padding': '10px', 'background': '#E77D2E', 'color': 'white', 'border': 'none', 'borderRadius': '4px', 'cursor': 'pointer',
+        'display': 'block' if signed_in else 'none'
+    })
+
 def serve_event_page(event_id, user_name=None, user_avail_set=None, signed_in=False):
-    session = SessionLocal()
+    session = ReadSession()
     event = session.query(When2MeetEvent).filter_by(url=event_id).first()
     session.close()
+    fragments = _event_page_fragments()
     if not event:
-        return html.Div([
-            html.H2('Event Not Found'),
-            html.P('Sorry, this event does not exist.')
-        ])
+        return fragments['not_found']
     # Get the full event link
     base_url = request.host_url.rstrip('/')
     event_link = f"{base_url}/event/{event_id}"
+    archived = event.archived_at is not None
     # Layout: event info at top, then sign-in, then grid, all centered and stacked
     return html.Div([
         html.Div([
             html.Div([
                 html.B('Share this link to invite others:'),
-                dcc.Input(value=event_link, readOnly=True, style={'width': '100%', 'marginTop': '8px', 'marginBottom': '16px', 'fontSize': '15px', 'background': '#232323', 'color': '#fff', 'border': '1px solid #5A8CC8', 'borderRadius': '4px'}),
-                html.A(
-                    "Export to Excel",
-                    href=f"/export_availability/{event_id}",
-                    target="_blank",
-                    style={
-                        'marginLeft': '12px',
-                        'fontWeight': 'bold',
-                        'color': '#E77D2E',
-                        'textDecoration': 'underline',
-                        'fontSize': '15px',
-                        'cursor': 'pointer'
-                    }
-                )
-            ], style={'maxWidth': '600px', 'margin': '0 auto', 'marginBottom': '12px', 'display': 'flex', 'alignItems': 'center'}),
-            html.H2(event.name, style={'marginBottom': '0.5em'}),
+                dcc.Input(value=event_link, readOnly=True, style=_SHARE_INPUT_STYLE),
+                html.A("Export to Excel", href=f"/export_availability/{event_id}", target="_blank", style=_LINK_STYLE),
+                html.A("View-only snapshot", href=f"/snapshot/{event_id}", target="_blank", style=_SNAPSHOT_LINK_STYLE),
+                None if archived else fragments['import_upload']
+            ], style=_SHARE_ROW_STYLE),
+            html.H2(event.name, style=_EVENT_TITLE_STYLE),
             html.P(f"Timezone: {event.timezone}"),
             html.P(f"Date Range: {event.start_date.date()} to {event.end_date.date()}"),
             html.P(f"Time Range: {event.start_time} to {event.end_time}"),
+            html.P("This event has ended and been archived; its availability is read-only.", style=_ARCHIVED_NOTE_STYLE) if archived else None,
             html.Hr(),
-        ], style={'textAlign': 'center', 'maxWidth': '600px', 'margin': '0 auto'}),
+        ], style=_EVENT_INFO_STYLE),
         html.Div([
-            html.Div([
-                html.Label('Your Name:'),
-                dcc.Input(id='event-username', type='text', placeholder='Enter your name', style={'width': '100%', 'marginBottom': '8px'}),
-                html.Label('Password (optional):'),
-                dcc.Input(id='event-password', type='password', placeholder='Optional', style={'width': '100%', 'marginBottom': '8px'}),
-                html.Button('Sign In', id='event-signin-btn', n_clicks=0, style={
-                    'width': '100%', 'fontSize': '16px', 'padding': '10px', 'background': '#E77D2E', 'color': 'white', 'border': 'none', 'borderRadius': '4px', 'cursor': 'pointer', 'marginBottom': '8px'
-                }),
-                html.Div(id='event-signin-output', style={'marginTop': '8px'})
-            ], style={'maxWidth': '350px', 'margin': '0 auto', 'marginBottom': '24px'}),
-            html.Div([
-                html.H3("Group's Availability", style={'textAlign': 'center', 'marginBottom': '8px'}),
-                html.Div([
-                    html.Span('1/14 Available', style={'fontSize': '12px', 'marginRight': '8px'}),
-                    html.Div(style={'display': 'inline-block', 'width': '80px', 'height': '16px', 'background': 'linear-gradient(to right, #fff, #5A8CC8)', 'verticalAlign': 'middle', 'marginRight': '8px'}),
-                    html.Span('14/14 Available', style={'fontSize': '12px'})
-                ], style={'textAlign': 'center', 'marginBottom': '4px'}),
-                html.Div('Mouseover or click a cell to see who is available', style={'textAlign': 'center', 'fontSize': '12px', 'marginBottom': '8px'}),
+            _event_signin_section(archived),
+            html.Div(fragments['grid_heading'] + [
                 html.Div([
-                    html.Div(render_availability_grid(event, user_avail_set, signed_in=bool(user_name), user_name=user_name), id='event-availability-grid', style={'overflowX': 'auto', 'maxWidth': '100vw', 'position': 'relative'}),
-                    html.Div(id='grid-tooltip', style={
-                        'display': 'none',
-                        'position': 'fixed',
-                        'zIndex': 9999,
-                        'background': 'white',
-                        'border': '1px solid #1976d2',
-                        'borderRadius': '6px',
-                        'padding': '8px',
-                        'boxShadow': '0 2px 8px rgba(0,0,0,0.15)',
-                        'fontSize': '13px',
-                        'pointerEvents': 'none',
-                        'minWidth': '180px',
-                        'maxWidth': '260px',
-                        'color': '#222',
-                    })
+                    html.Div(render_availability_grid(event, user_avail_set, signed_in=bool(user_name), user_name=user_name), id='event-availability-grid', style=_GRID_WRAPPER_STYLE),
+                    fragments['tooltip']
                 ], style={'position': 'relative'}),
-                html.Button('Save My Availability', id='save-availability-btn', n_clicks=0, style={
-                    'marginTop': '16px', 'width': '100%', 'fontSize': '16px', 'padding': '10px', 'background': '#E77D2E', 'color': 'white', 'border': 'none', 'borderRadius': '4px', 'cursor': 'pointer',
-                    'display': 'block' if signed_in else 'none'
-                }),
-                html.Div(id='grid-message', style={'textAlign': 'center', 'color': '#d32f2f', 'marginTop': '8px'})
+                _save_availability_button(bool(signed_in)),
+                fragments['grid_message']
             ], style={'width': '100%', 'maxWidth': '600px', 'margin': '0 auto'})
         ], style={'display': 'flex', 'flexDirection': 'column', 'alignItems': 'center'})
     ])
@@ -369,6 +921,8 @@ def serve_event_page(event_id, user_name=None, user_avail_set=None, signed_in=Fa
 def display_page(pathname):
     if pathname == '/admin':
         return serve_admin_page()
+    if pathname == '/freebusy':
+        return serve_freebusy_page()
     if pathname and pathname.startswith('/event/'):
         event_id = pathname.split('/event/')[1]
         return serve_event_page(event_id)
@@ -424,6 +978,7 @@ def create_event(n_clicks, event_name, timezone, start_date, end_date, start_hou
         session.add(event)
         session.commit()
         session.close()
+        mark_primary_sticky()
         link = dcc.Link(f'Share this link: /event/{event_url}', href=f'/event/{event_url}', style={'fontWeight': 'bold', 'fontSize': '1.1em'})
         return link, f'/event/{event_url}'
     except Exception as e:
@@ -470,7 +1025,7 @@ def load_user_availability(user_data, pathname):
     if not user_data or not user_data.get('username') or not pathname or '/event/' not in pathname:
         return {}
     event_id = pathname.split('/event/')[1]
-    session = SessionLocal()
+    session = ReadSession()
     event = session.query(When2MeetEvent).filter_by(url=event_id).first()
     if not event:
         session.close()
@@ -483,123 +1038,53 @@ def load_user_availability(user_data, pathname):
     session.close()
     return list(user_avail)
 
-# Pattern-matching callback for cell, row, and column header clicks
+# Cell, row, and column header clicks. assets/grid_events.js listens once on the page and
+# writes only the clicked coordinates to grid-click-store, so the request size doesn't grow
+# with the grid.
 @app.callback(
     Output('user-availability-store', 'data', allow_duplicate=True),
     Output('grid-message', 'children', allow_duplicate=True),
-    Input({'type': 'grid-cell', 'id': ALL}, 'n_clicks'),
-    Input({'type': 'row-header', 'time': ALL}, 'n_clicks'),
-    Input({'type': 'col-header', 'date': ALL}, 'n_clicks'),
+    Input('grid-click-store', 'data'),
     State('user-availability-store', 'data'),
     State('event-user-store', 'data'),
     State('url', 'pathname'),
     prevent_initial_call=True
 )
-def toggle_user_availability(cell_clicks, row_clicks, col_clicks, user_avail, user_data, pathname):
-    ctx = callback_context
-    if not ctx.triggered or not user_data or not user_data.get('username'):
+def toggle_user_availability(grid_click, user_avail, user_data, pathname):
+    if not grid_click:
+        return dash.no_update, ''
+    if not user_data or not user_data.get('username'):
         return dash.no_update, 'Sign in to edit your availability.'
-    prop_id = ctx.triggered[0]['prop_id']
-    print(f"DEBUG: Triggered prop_id: {prop_id}")  # Debug line
-    print(f"DEBUG: All cell_clicks: {cell_clicks}")  # Debug line
-    print(f"DEBUG: All row_clicks: {row_clicks}")  # Debug line
-    print(f"DEBUG: All col_clicks: {col_clicks}")  # Debug line
-    print(f"DEBUG: Which callback triggered: {ctx.triggered[0]['prop_id']}")  # Debug line
+    if not pathname or '/event/' not in pathname:
+        return dash.no_update, ''
     user_avail = set(tuple(x) for x in (user_avail or []))
+    kind = grid_click.get('kind')
     # Handle cell click
-    if 'grid-cell' in prop_id:
-        print("DEBUG: Processing grid-cell click")  # Debug line
-        cell_dict = json.loads(prop_id.split('.')[0])
-        print(f"DEBUG: Cell dict: {cell_dict}")  # Debug line
-        # Use the date and time properties directly from the cell ID
-        id_parts = cell_dict['id'].split('-')
-        date_str = f"{id_parts[0]}-{id_parts[1]}-{id_parts[2]}"
-        time_str = id_parts[3]
-        key = (date_str, time_str)
-        print(f"DEBUG: Toggling key: {key}")  # Debug line
+    if kind == 'cell':
+        key = (grid_click.get('date'), grid_click.get('time'))
         if key in user_avail:
             user_avail.remove(key)
         else:
             user_avail.add(key)
         return list(user_avail), ''
-    # Handle row header click
-    if 'row-header' in prop_id:
-        print("DEBUG: Processing row-header click")  # Debug line
-        row_dict = json.loads(prop_id.split('.')[0])
-        time = row_dict['time']
-        # Find the index of the triggered row header
-        triggered_idx = None
-        for i, inp in enumerate(ctx.inputs_list[1]):
-            if inp['id'] == row_dict:
-                triggered_idx = i
-                break
-        if triggered_idx is None or row_clicks[triggered_idx] is None:
-            print("DEBUG: Ignoring row-header click - not a real click")
-            return dash.no_update, ''
-        # Get all dates for this event
-        event_id = pathname.split('/event/')[1]
-        session = SessionLocal()
-        event = session.query(When2MeetEvent).filter_by(url=event_id).first()
-        session.close()
-        if not event:
-            return dash.no_update, 'Event not found.'
-        start_date = event.start_date.date()
-        end_date = event.end_date.date()
-        num_days = (end_date - start_date).days + 1
-        dates = [start_date + datetime.timedelta(days=i) for i in range(num_days)]
-        # Build all keys for this row
-        row_keys = [(str(date), time) for date in dates]
-        # Toggle: if all are selected, clear; else, select all
-        if all(key in user_avail for key in row_keys):
-            for key in row_keys:
-                user_avail.discard(key)
-        else:
-            for key in row_keys:
-                user_avail.add(key)
-        return list(user_avail), ''
-    # Handle column header click
-    if 'col-header' in prop_id:
-        print("DEBUG: Processing col-header click")  # Debug line
-        col_dict = json.loads(prop_id.split('.')[0])
-        date = col_dict['date']
-        # Find the index of the triggered col header
-        triggered_idx = None
-        for i, inp in enumerate(ctx.inputs_list[2]):
-            if inp['id'] == col_dict:
-                triggered_idx = i
-                break
-        if triggered_idx is None or col_clicks[triggered_idx] is None:
-            print("DEBUG: Ignoring col-header click - not a real click")
-            return dash.no_update, ''
-        print(f"DEBUG: Column header date: {date}")  # Debug line
-        # Get all times for this event
-        event_id = pathname.split('/event/')[1]
-        session = SessionLocal()
-        event = session.query(When2MeetEvent).filter_by(url=event_id).first()
-        session.close()
-        if not event:
-            return dash.no_update, 'Event not found.'
-        def parse_time(tstr):
-            h, m = map(int, tstr.split(':'))
-            return datetime.time(hour=h, minute=m)
-        start_time = parse_time(event.start_time)
-        end_time = parse_time(event.end_time)
-        slots = []
-        t = datetime.datetime.combine(datetime.date.today(), start_time)
-        end_dt = datetime.datetime.combine(datetime.date.today(), end_time)
-        while t <= end_dt:
-            slots.append(t.time())
-            t += datetime.timedelta(minutes=30)
-        col_keys = [(date, slot.strftime('%H:%M')) for slot in slots]
-        # Toggle: if all are selected, clear; else, select all
-        if all(key in user_avail for key in col_keys):
-            for key in col_keys:
-                user_avail.discard(key)
-        else:
-            for key in col_keys:
-                user_avail.add(key)
-        return list(user_avail), ''
-    return dash.no_update, ''
+    if kind not in ('row', 'col'):
+        return dash.no_update, ''
+    geometry = get_event_geometry_for_url(pathname.split('/event/')[1])
+    if geometry is None:
+        return dash.no_update, 'Event not found.'
+    # Handle row header click (one time, every date) or column header click (one date, every time)
+    if kind == 'row':
+        keys = geometry.row_keys.get(grid_click.get('time'), [])
+    else:
+        keys = geometry.col_keys.get(grid_click.get('date'), [])
+    # Toggle: if all are selected, clear; else, select all
+    if all(key in user_avail for key in keys):
+        for key in keys:
+            user_avail.discard(key)
+    else:
+        for key in keys:
+            user_avail.add(key)
+    return list(user_avail), ''
 
 # Render the grid with user's local availability
 @app.callback(
@@ -615,7 +1100,7 @@ def render_grid(user_avail, user_data, pathname):
     event_id = pathname.split('/event/')[1]
     user_name = user_data['username'] if user_data and user_data.get('username') else None
     user_avail_set = set(tuple(x) for x in (user_avail or []))
-    session = SessionLocal()
+    session = ReadSession()
     event = session.query(When2MeetEvent).filter_by(url=event_id).first()
     session.close()
     if not event:
@@ -640,78 +1125,109 @@ def save_user_availability(n_clicks, user_avail, user_data, pathname):
     if not event:
         session.close()
         return 'Event not found.'
-    # Remove all previous availabilities for this user/event
-    session.query(When2MeetAvailability).filter_by(event_id=event.id, user_name=user_data['username']).delete()
-    # Add new availabilities
-    for d, t in (user_avail or []):
-        slot_key = f'{d}T{t}'
-        new_avail = When2MeetAvailability(
-            event_id=event.id,
-            user_name=user_data['username'],
-            time_slot=slot_key,
-            available=True
-        )
-        session.add(new_avail)
+    user_name = user_data['username']
+    new_keys = set(tuple(x) for x in (user_avail or []))
+    try:
+        _lock_participants(session, event.id, [user_name])
+        old_keys = set()
+        for (time_slot,) in session.query(When2MeetAvailability.time_slot).filter_by(event_id=event.id, user_name=user_name):
+            dt = time_slot.split('T')
+            if len(dt) == 2:
+                old_keys.add((dt[0], dt[1]))
+        # Only touch the slots that changed: delete the removed ones, upsert the added ones
+        removed = [f'{d}T{t}' for d, t in old_keys - new_keys]
+        if removed:
+            session.query(When2MeetAvailability).filter(
+                When2MeetAvailability.event_id == event.id,
+                When2MeetAvailability.user_name == user_name,
+                When2MeetAvailability.time_slot.in_(removed)
+            ).delete(synchronize_session=False)
+        added = [
+            {'event_id': event.id, 'user_name': user_name, 'time_slot': f'{d}T{t}', 'available': True}
+            for d, t in new_keys - old_keys
+        ]
+        if added:
+            session.execute(_insert_ignoring_duplicates(), added)
+        # Bump the event's availability version last so the event row is locked only until commit.
+        # Archived events are read-only.
+        updated = session.query(When2MeetEvent).filter(When2MeetEvent.id == event.id, When2MeetEvent.archived_at.is_(None)).update(
+            {When2MeetEvent.availability_version: When2MeetEvent.availability_version + 1}, synchronize_session=False)
+        if not updated:
+            session.rollback()
+            session.close()
+            return 'This event has been archived and is read-only.'
+        new_version = session.query(When2MeetEvent.availability_version).filter_by(id=event.id).scalar()
+    except Exception:
+        session.rollback()
+        session.close()
+        raise
+    event_pk = event.id
     session.commit()
     session.close()
+    mark_primary_sticky()
+    _write_through_aggregates(event_pk, new_version - 1, new_version, user_name, old_keys, new_keys)
     return 'Your availability has been saved! The group grid is now updated.'
 
+# Saves for one participant are serialized: a transaction-scoped advisory lock on
+# (event, participant) on Postgres, and BEGIN IMMEDIATE on SQLite, which allows a single writer
+# and would otherwise let the slots read before the first write go stale.
+# Every writer takes these locks first, in sorted name order, and bumps the event's
+# availability version last, so a save and an import never wait on each other in opposite order.
+def _lock_participants(session, event_id, user_names):
+    if engine.dialect.name == 'postgresql':
+        for user_name in sorted(set(user_names)):
+            session.execute(text('SELECT pg_advisory_xact_lock(:event_id, hashtext(:user_name))'), {'event_id': event_id, 'user_name': user_name})
+    elif engine.dialect.name == 'sqlite':
+        session.connection().exec_driver_sql('BEGIN IMMEDIATE')
+
+def _insert_ignoring_duplicates():
+    index_elements = ['event_id', 'user_name', 'time_slot']
+    if engine.dialect.name == 'postgresql':
+        return pg_insert(When2MeetAvailability).on_conflict_do_nothing(index_elements=index_elements)
+    if engine.dialect.name == 'sqlite':
+        return sqlite_insert(When2MeetAvailability).on_conflict_do_nothing(index_elements=index_elements)
+    return insert(When2MeetAvailability)
+
 # Add a callback to update the tooltip content and position
 @app.callback(
     Output('grid-tooltip', 'children', allow_duplicate=True),
     Output('grid-tooltip', 'style', allow_duplicate=True),
-    Input('event-availability-grid', 'n_mouseover'),
-    Input({'type': 'grid-cell', 'id': ALL}, 'n_mouseover'),
+    Input('grid-hover-store', 'data'),
     State('event-user-store', 'data'),
     State('user-availability-store', 'data'),
     State('url', 'pathname'),
     State('grid-tooltip', 'style'),
     prevent_initial_call=True
 )
-def show_grid_tooltip(grid_mouseover, cell_mouseovers, user_data, user_avail, pathname, tooltip_style):
-    ctx = callback_context
-    if not ctx.triggered:
-        return dash.no_update, dash.no_update
+def show_grid_tooltip(grid_hover, user_data, user_avail, pathname, tooltip_style):
     # Don't show tooltips when user is signed in (editing their availability)
     if user_data and user_data.get('username'):
         style = tooltip_style.copy() if tooltip_style else {}
         style['display'] = 'none'
         return '', style
-    # Find which cell was hovered
-    prop_id = ctx.triggered[0]['prop_id']
-    if 'grid-cell' not in prop_id:
+    # grid-hover-store holds the hovered cell's coordinates, or None once the pointer leaves the cells
+    if not grid_hover:
         # Hide tooltip if not on a cell
         style = tooltip_style.copy() if tooltip_style else {}
         style['display'] = 'none'
         return '', style
-    # Get cell id
-    cell_id = json.loads(prop_id.split('.')[0].replace("'", '"'))
-    id_parts = cell_id['id'].split('-')
-    date = f"{id_parts[0]}-{id_parts[1]}-{id_parts[2]}"
-    time = id_parts[3]
+    date = grid_hover.get('date')
+    time = grid_hover.get('time')
     # Get event and availability info
     if not pathname or '/event/' not in pathname:
         return dash.no_update, dash.no_update
     event_id = pathname.split('/event/')[1]
-    session = SessionLocal()
+    session = ReadSession()
     event = session.query(When2MeetEvent).filter_by(url=event_id).first()
-    availabilities = session.query(When2MeetAvailability).filter_by(event_id=event.id).all() if event else []
     session.close()
-    avail_dict = {}
-    all_names = set()
-    for a in availabilities:
-        dt = a.time_slot.split('T')
-        if len(dt) == 2:
-            d, t = dt
-            avail_dict.setdefault((d, t), []).append(a.user_name)
-            all_names.add(a.user_name)
+    # Use this worker's in-memory aggregates when current, otherwise fetch only the hovered slot's names
+    cached = _cached_aggregates(event.id, event.availability_version or 0) if event else None
+    if cached is not None:
+        available_names = cached[1].get((date, time), [])
+    else:
+        available_names = get_slot_names(event.id, date, time) if event else []
     user_avail_set = set(tuple(x) for x in (user_avail or []))
-    if user_avail_set:
-        for d, t in user_avail_set:
-            all_names.add('You')
-    all_names = sorted(all_names)
     key = (date, time)
-    available_names = avail_dict.get(key, [])
     is_user = user_avail_set and key in user_avail_set
     # Only add 'You' if the user's actual name is not already in the list
     if is_user and user_data and user_data.get('username') not in available_names:
@@ -763,6 +1279,16 @@ def go_admin_on_btn(n_clicks):
         return '/admin'
     return dash.no_update
 
+@app.callback(
+    Output('url', 'pathname', allow_duplicate=True),
+    Input('freebusy-btn', 'n_clicks'),
+    prevent_initial_call=True
+)
+def go_freebusy_on_btn(n_clicks):
+    if n_clicks:
+        return '/freebusy'
+    return dash.no_update
+
 # Admin page scaffold
 
 def serve_admin_page():
@@ -780,84 +1306,274 @@ def serve_admin_page():
         ], style={'maxWidth': '350px', 'margin': '0 auto'}, className='admin-form')
     ])
 
-def serve_admin_dashboard(message=None):
-    # Fetch all events
+# Background job runner. Heavy exports and admin summaries run on a small thread pool instead of
+# inside the request; the caller gets a job id to poll. Jobs are deduplicated by cache_key (which
+# includes the availability versions they were built from), so a finished result is reused until
+# the data changes or JOB_RESULT_TTL_SECONDS passes. Job rows are always read from the primary.
+JOB_WORKERS = int(os.environ.get('JOB_WORKERS', '2'))
+JOB_RESULT_TTL_SECONDS = int(os.environ.get('JOB_RESULT_TTL_SECONDS', '3600'))
+# Queued/running jobs older than this are assumed lost with a restarted worker and run again
+JOB_STALE_SECONDS = int(os.environ.get('JOB_STALE_SECONDS', '600'))
+# How long a request waits for a job it just started, so small exports still come back inline
+JOB_INLINE_WAIT_SECONDS = float(os.environ.get('JOB_INLINE_WAIT_SECONDS', '0.3'))
+_job_executor = ThreadPoolExecutor(max_workers=JOB_WORKERS, thread_name_prefix='job')
+_job_handlers = {}
+# Guards _job_futures so a worker submits each job once and a run can't drop its entry before it's added
+_job_futures = {}
+_job_futures_lock = threading.Lock()
+
+def job_handler(kind):
+    def register(fn):
+        _job_handlers[kind] = fn
+        return fn
+    return register
+
+def _job_info(job):
+    return {
+        'id': job.id, 'kind': job.kind, 'status': job.status, 'progress': job.progress,
+        'error': job.error, 'params': json.loads(job.params), 'result': job.result,
+    }
+
+def get_job(job_id):
     session = SessionLocal()
+    try:
+        job = session.get(When2MeetJob, job_id)
+        return _job_info(job) if job is not None else None
+    finally:
+        session.close()
+
+def _update_job(job_id, **values):
+    session = SessionLocal()
+    try:
+        session.query(When2MeetJob).filter_by(id=job_id).update(values)
+        session.commit()
+    finally:
+        session.close()
+
+def _job_read_session(params):
+    # Jobs do the heaviest reads, so they go to the replica, unless it lags the
+    # [event id, availability_version, archived] list their cache_key was built from
+    # (then the result would be cached under a version it doesn't reflect)
+    if ReplicaSessionLocal is None:
+        return SessionLocal()
+    expected = {event_id: (version, archived) for event_id, version, archived in params.get('versions', [])}
+    session = ReplicaSessionLocal()
+    query = session.query(When2MeetEvent.id, When2MeetEvent.availability_version, When2MeetEvent.archived_at.isnot(None))
+    if not params.get('all_events'):
+        query = query.filter(When2MeetEvent.id.in_(expected))
+    seen = {event_id: (version, archived) for event_id, version, archived in query}
+    if seen.keys() == expected.keys() and all(
+        seen[event_id][0] >= version and (seen[event_id][1] or not archived) for event_id, (version, archived) in expected.items()
+    ):
+        return session
+    session.close()
+    return SessionLocal()
+
+def _find_live_job(session, cache_key):
+    return session.query(When2MeetJob).filter(When2MeetJob.cache_key == cache_key, When2MeetJob.status != 'failed').first()
+
+def submit_job(kind, cache_key, params=None, wait=JOB_INLINE_WAIT_SECONDS):
+    now = datetime.datetime.now()
+    session = SessionLocal()
+    try:
+        session.query(When2MeetJob).filter(
+            When2MeetJob.finished_at < now - datetime.timedelta(seconds=JOB_RESULT_TTL_SECONDS)
+        ).delete(synchronize_session=False)
+        # Jobs left behind by a worker that went away; failing them frees their key
+        session.query(When2MeetJob).filter(
+            When2MeetJob.status.in_(('queued', 'running')),
+            When2MeetJob.created_at < now - datetime.timedelta(seconds=JOB_STALE_SECONDS)
+        ).update({'status': 'failed', 'error': 'Job was abandoned', 'finished_at': now}, synchronize_session=False)
+        session.commit()
+        job = _find_live_job(session, cache_key)
+        if job is None:
+            job = When2MeetJob(id=uuid.uuid4().hex, kind=kind, cache_key=cache_key, params=json.dumps(params or {}),
+                               status='queued', progress=0, created_at=now)
+            session.add(job)
+            try:
+                session.commit()
+            except IntegrityError:
+                # Another request inserted a job for this key first: use that one
+                session.rollback()
+                job = _find_live_job(session, cache_key)
+        info = _job_info(job)
+    finally:
+        session.close()
+    # Any worker may submit a queued job it finds; _run_job lets only one of them claim it
+    with _job_futures_lock:
+        if info['status'] == 'queued' and info['id'] not in _job_futures:
+            _job_futures[info['id']] = _job_executor.submit(_run_job, info['id'])
+        future = _job_futures.get(info['id'])
+    if info['status'] != 'done' and future is not None and wait:
+        wait_futures([future], timeout=wait)
+        if future.done():
+            info = get_job(info['id'])
+    return info
+
+def _finish_job(job_id, **values):
+    # Only the claiming run may finish a job, and not once it has been failed as abandoned
+    session = SessionLocal()
+    try:
+        session.query(When2MeetJob).filter_by(id=job_id, status='running').update(values)
+        session.commit()
+    finally:
+        session.close()
+
+def _run_job(job_id):
+    try:
+        session = SessionLocal()
+        try:
+            # Claim the job atomically; a run that loses the race does nothing
+            claimed = session.query(When2MeetJob).filter_by(id=job_id, status='queued').update({'status': 'running'})
+            session.commit()
+            if claimed != 1:
+                return
+            job = session.get(When2MeetJob, job_id)
+            kind, params = job.kind, json.loads(job.params)
+        finally:
+            session.close()
+        started = time.perf_counter()
+        last_report = [started]
+
+        def report(fraction):
+            # At most a few progress writes per second
+            now = time.perf_counter()
+            if now - last_report[0] >= 0.25:
+                last_report[0] = now
+                _update_job(job_id, progress=round(min(fraction, 0.99), 3))
+
+        try:
+            result = _job_handlers[kind](params, report)
+        except Exception as e:
+            _finish_job(job_id, status='failed', error=str(e), finished_at=datetime.datetime.now())
+            print(f"JOB: {kind} {job_id} failed: {e}")
+            return
+        _finish_job(job_id, status='done', progress=1, result=result, finished_at=datetime.datetime.now())
+        print(f"JOB: {kind} {job_id} done in {time.perf_counter() - started:.2f}s ({len(result)} bytes)")
+    finally:
+        with _job_futures_lock:
+            _job_futures.pop(job_id, None)
+
+@server.route('/jobs/<job_id>')
+def job_status(job_id):
+    job = get_job(job_id)
+    if job is None:
+        return jsonify({'error': 'Job not found'}), 404
+    body = {key: job[key] for key in ('id', 'kind', 'status', 'progress', 'error')}
+    if job['status'] == 'done':
+        body['result_url'] = f'/jobs/{job_id}/result'
+    return jsonify(body)
+
+_JOB_MIMETYPES = {
+    'export': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    'admin_summary': 'application/json',
+}
+
+@server.route('/jobs/<job_id>/result')
+def job_result(job_id):
+    job = get_job(job_id)
+    if job is None:
+        return "Job not found", 404
+    if job['status'] != 'done':
+        return jsonify({'error': f"Job is {job['status']}"}), 409
+    filename = job['params'].get('filename')
+    return send_file(io.BytesIO(job['result']), download_name=filename, as_attachment=filename is not None,
+                     mimetype=_JOB_MIMETYPES[job['kind']])
+
+# Admin summaries are built by a background job (see submit_job) from plain data, and rendered here
+def admin_summary_versions():
+    session = ReadSession()
+    versions = session.query(When2MeetEvent.id, When2MeetEvent.availability_version, When2MeetEvent.archived_at.isnot(None)).order_by(When2MeetEvent.id).all()
+    session.close()
+    return [list(v) for v in versions]
+
+def admin_summary_cache_key(versions):
+    return f"admin_summary:{hashlib.sha1(json.dumps(versions).encode()).hexdigest()}"
+
+# Helper to merge consecutive times into ranges
+def merge_times(times):
+    times = sorted(times)
+    ranges = []
+    i = 0
+    while i < len(times):
+        start = times[i]
+        j = i
+        while j+1 < len(times) and (
+            datetime.datetime.strptime(times[j+1], '%H:%M') - datetime.datetime.strptime(times[j], '%H:%M')).seconds == 1800:
+            j += 1
+        end = times[j]
+        # Format nicely
+        start_dt = datetime.datetime.strptime(start, '%H:%M')
+        end_dt = datetime.datetime.strptime(end, '%H:%M') + datetime.timedelta(minutes=30)
+        if start == end:
+            label = start_dt.strftime('%#I:%M%p').lower()
+        else:
+            label = f"{start_dt.strftime('%#I:%M')}-{end_dt.strftime('%#I:%M%p').lower()}"
+        ranges.append(label)
+        i = j+1
+    return ', '.join(ranges)
+
+@job_handler('admin_summary')
+def build_admin_summary(params, report):
+    # Fetch all events
+    session = _job_read_session(params)
     events = session.query(When2MeetEvent).order_by(When2MeetEvent.id.desc()).all()
-    event_rows = []
-    for event in events:
-        # Fetch availabilities for this event
-        availabilities = session.query(When2MeetAvailability).filter_by(event_id=event.id).all()
+    summaries = []
+    for n, event in enumerate(events):
         # Build user->date->set(times) mapping
         user_date_times = {}
-        for a in availabilities:
-            dt = a.time_slot.split('T')
+        for user_name, time_slot in session.query(When2MeetAvailability.user_name, When2MeetAvailability.time_slot).filter_by(event_id=event.id):
+            dt = time_slot.split('T')
             if len(dt) == 2:
                 d, t = dt
-                user_date_times.setdefault(a.user_name, {}).setdefault(d, set()).add(t)
-        # Get all users and all dates for this event
-        users = sorted(user_date_times.keys())
-        start_date = event.start_date.date()
-        end_date = event.end_date.date()
-        num_days = (end_date - start_date).days + 1
-        dates = [str(start_date + datetime.timedelta(days=i)) for i in range(num_days)]
-        # Get all possible times for this event
-        def parse_time(tstr):
-            h, m = map(int, tstr.split(':'))
-            return datetime.time(hour=h, minute=m)
-        start_time = parse_time(event.start_time)
-        end_time = parse_time(event.end_time)
-        slots = []
-        t = datetime.datetime.combine(datetime.date.today(), start_time)
-        end_dt = datetime.datetime.combine(datetime.date.today(), end_time)
-        while t <= end_dt:
-            slots.append(t.time())
-            t += datetime.timedelta(minutes=30)
-        slot_strs = [s.strftime('%H:%M') for s in slots]
-        # Helper to merge consecutive times into ranges
-        def merge_times(times):
-            times = sorted(times)
-            ranges = []
-            i = 0
-            while i < len(times):
-                start = times[i]
-                j = i
-                while j+1 < len(times) and (
-                    datetime.datetime.strptime(times[j+1], '%H:%M') - datetime.datetime.strptime(times[j], '%H:%M')).seconds == 1800:
-                    j += 1
-                end = times[j]
-                # Format nicely
-                start_dt = datetime.datetime.strptime(start, '%H:%M')
-                end_dt = datetime.datetime.strptime(end, '%H:%M') + datetime.timedelta(minutes=30)
-                if start == end:
-                    label = start_dt.strftime('%#I:%M%p').lower()
-                else:
-                    label = f"{start_dt.strftime('%#I:%M')}-{end_dt.strftime('%#I:%M%p').lower()}"
-                ranges.append(label)
-                i = j+1
-            return ', '.join(ranges)
+                user_date_times.setdefault(user_name, {}).setdefault(d, set()).add(t)
+        # Archived events keep their availability in the compact archive row
+        if event.archived_at is not None:
+            user_date_times = archived_user_date_times(event, session)
+        geometry = get_event_geometry(event)
+        dates = geometry.date_strs
+        summaries.append({
+            'id': event.id,
+            'name': event.name,
+            'url': event.url,
+            'timezone': event.timezone,
+            'date_range': f"{event.start_date.date()} to {event.end_date.date()}",
+            'dates': [label for _, _, label in geometry.date_labels],
+            # One merged-range label per date, or None where the user marked nothing
+            'users': [
+                [user, [merge_times(user_date_times[user][d]) if d in user_date_times[user] else None for d in dates]]
+                for user in sorted(user_date_times)
+            ],
+        })
+        report((n + 1) / len(events))
+    session.close()
+    return json.dumps({'events': summaries}, separators=(',', ':')).encode()
+
+def render_admin_summary(summary):
+    event_rows = []
+    for event in summary['events']:
         # Build compact summary table
-        if users:
+        if event['users']:
             summary_table = html.Table([
-                html.Thead(html.Tr([html.Th('User')] + [html.Th(datetime.datetime.strptime(d, '%Y-%m-%d').strftime('%a %b %d')) for d in dates])),
+                html.Thead(html.Tr([html.Th('User')] + [html.Th(label) for label in event['dates']])),
                 html.Tbody([
                     html.Tr([
                         html.Td(user)
                     ] + [
-                        html.Td(merge_times(user_date_times[user].get(d, [])) if d in user_date_times[user] else '—', style={'color': '#5a8cc8' if d in user_date_times[user] else '#aaa'})
-                        for d in dates
-                    ]) for user in users
+                        html.Td(cell if cell is not None else '—', style={'color': '#5a8cc8' if cell is not None else '#aaa'})
+                        for cell in cells
+                    ]) for user, cells in event['users']
                 ])
             ], style={'margin': '8px 0 16px 0', 'background': '#232323', 'color': '#f5f5f5', 'borderRadius': '6px', 'fontSize': '13px', 'width': 'auto', 'textAlign': 'center'})
         else:
             summary_table = html.Div('No availabilities yet.', style={'fontSize': '13px', 'color': '#aaa', 'margin': '8px 0 16px 0'})
         event_rows.append(html.Tr([
-            html.Td(event.name),
-            html.Td(html.A(f'/event/{event.url}', href=f'/event/{event.url}', target='_blank', style={'color': '#E77D2E'})),
-            html.Td(event.timezone),
-            html.Td(f"{event.start_date.date()} to {event.end_date.date()}"),
+            html.Td(event['name']),
+            html.Td(html.A(f"/event/{event['url']}", href=f"/event/{event['url']}", target='_blank', style={'color': '#E77D2E'})),
+            html.Td(event['timezone']),
+            html.Td(event['date_range']),
             html.Td([
-                html.Button('Delete', id={'type': 'delete-event-btn', 'id': event.id}, n_clicks=0, className='delete-btn', style={
+                html.Button('Delete', id={'type': 'delete-event-btn', 'id': event['id']}, n_clicks=0, className='delete-btn', style={
                     'background': '#E77D2E', 'color': 'white', 'border': 'none', 'borderRadius': '4px', 'padding': '4px 10px', 'cursor': 'pointer', 'fontSize': '13px'
                 })
             ])
@@ -866,19 +1582,45 @@ def serve_admin_dashboard(message=None):
         event_rows.append(html.Tr([
             html.Td(summary_table, colSpan=5, style={'background': '#181818', 'padding': '8px 0 16px 0'})
         ]))
-    session.close()
     table = html.Table([
         html.Thead(html.Tr([
             html.Th('Event Name'), html.Th('Link'), html.Th('Timezone'), html.Th('Date Range'), html.Th('Actions')
         ])),
         html.Tbody(event_rows)
     ], className='admin-dashboard-table')
+    return html.Div(table, className='admin-dashboard-table-wrapper')
+
+def _admin_summary_body(job):
+    if job is None:
+        return html.P('The summary job has expired. Sign in again to rebuild it.', style={'color': '#aaa'})
+    if job['status'] == 'done':
+        return render_admin_summary(json.loads(job['result']))
+    if job['status'] == 'failed':
+        return html.P(f"Could not build event summaries: {job['error']}", style={'color': '#E77D2E'})
+    return html.P(f"Building event summaries… {round(job['progress'] * 100)}%", style={'color': '#aaa'})
+
+def serve_admin_dashboard(message=None):
+    versions = admin_summary_versions()
+    job = submit_job('admin_summary', admin_summary_cache_key(versions), {'versions': versions, 'all_events': True})
     return html.Div([
         html.H2('Admin Dashboard'),
         html.P(message, style={'color': '#E77D2E'}) if message else None,
-        html.Div(table, className='admin-dashboard-table-wrapper')
+        html.Div(_admin_summary_body(job), id='admin-dashboard-body'),
+        dcc.Store(id='admin-summary-job', data=job['id']),
+        dcc.Interval(id='admin-summary-poll', interval=1000, disabled=job['status'] in ('done', 'failed'))
     ])
 
+@app.callback(
+    Output('admin-dashboard-body', 'children'),
+    Output('admin-summary-poll', 'disabled'),
+    Input('admin-summary-poll', 'n_intervals'),
+    State('admin-summary-job', 'data'),
+    prevent_initial_call=True
+)
+def poll_admin_summary(n_intervals, job_id):
+    job = get_job(job_id)
+    return _admin_summary_body(job), job is None or job['status'] in ('done', 'failed')
+
 @app.callback(
     Output('admin-signin-output', 'children'),
     Output('page-content', 'children', allow_duplicate=True),
@@ -922,11 +1664,18 @@ def admin_delete_event(delete_clicks, page_content):
         if idx is None:
             return dash.no_update
         session = SessionLocal()
-        # Delete availabilities first
+        event = session.query(When2MeetEvent).filter_by(id=btn_id).first()
+        if event:
+            with _geometry_by_url_lock:
+                _geometry_by_url.pop(event.url, None)
+        # Delete availabilities (and any archive) first
         session.query(When2MeetAvailability).filter_by(event_id=btn_id).delete()
+        session.query(When2MeetArchiveParticipant).filter_by(event_id=btn_id).delete()
+        session.query(When2MeetEventArchive).filter_by(event_id=btn_id).delete()
         session.query(When2MeetEvent).filter_by(id=btn_id).delete()
         session.commit()
         session.close()
+        mark_primary_sticky()
         return serve_admin_dashboard(message='Event deleted.')
     except Exception as e:
         return serve_admin_dashboard(message=f'Error deleting event: {e}')
@@ -944,63 +1693,843 @@ def refresh_page_after_save(n_clicks, pathname):
         return pathname
     return dash.no_update
 
-# Add Flask route for Excel export
-@server.route('/export_availability/<event_id>')
-def export_availability(event_id):
-    session = SessionLocal()
-    event = session.query(When2MeetEvent).filter_by(url=event_id).first()
+# Excel export: the workbook is built by a background job and cached per availability version.
+# Small events come back inline; larger ones get a page that polls the job and then downloads it.
+_EXPORT_PENDING_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Preparing export</title></head>
+<body style="font-family:sans-serif;background:#181818;color:#f5f5f5;padding:40px">
+<p id="status">Preparing your export&hellip;</p>
+<script>
+(function () {
+    var jobId = {job_id};
+    var status = document.getElementById('status');
+    function poll() {
+        fetch('/jobs/' + jobId).then(function (r) { return r.json(); }).then(function (job) {
+            if (job.status === 'done') {
+                status.textContent = 'Export ready.';
+                window.location = job.result_url;
+            } else if (job.status === 'failed' || job.error) {
+                status.textContent = 'Export failed: ' + (job.error || 'unknown error');
+            } else {
+                status.textContent = 'Preparing your export\u2026 ' + Math.round(job.progress * 100) + '%';
+                setTimeout(poll, 1000);
+            }
+        });
+    }
+    poll();
+})();
+</script>
+</body></html>
+"""
+
+@job_handler('export')
+def build_availability_workbook(params, report):
+    session = _job_read_session(params)
+    event = session.query(When2MeetEvent).filter_by(url=params['event_url']).first()
     if not event:
         session.close()
-        return "Event not found", 404
+        raise ValueError('Event not found')
     # Get all availabilities for this event
-    availabilities = session.query(When2MeetAvailability).filter_by(event_id=event.id).all()
+    availabilities = session.query(When2MeetAvailability.user_name, When2MeetAvailability.time_slot).filter_by(event_id=event.id).all()
+    archived_slots = archived_user_date_times(event, session) if event.archived_at is not None else None
     session.close()
     # Build user/date/time mapping
     user_date_times = {}
-    for a in availabilities:
-        dt = a.time_slot.split('T')
+    for user_name, time_slot in availabilities:
+        dt = time_slot.split('T')
         if len(dt) == 2:
             d, t = dt
-            user_date_times.setdefault(a.user_name, {}).setdefault(d, set()).add(t)
+            user_date_times.setdefault(user_name, {}).setdefault(d, set()).add(t)
+    if archived_slots is not None:
+        user_date_times = archived_slots
     users = sorted(user_date_times.keys())
-    start_date = event.start_date.date()
-    end_date = event.end_date.date()
-    num_days = (end_date - start_date).days + 1
-    dates = [str(start_date + datetime.timedelta(days=i)) for i in range(num_days)]
-    # Get all possible times for this event
-    def parse_time(tstr):
-        h, m = map(int, tstr.split(':'))
-        return datetime.time(hour=h, minute=m)
-    start_time = parse_time(event.start_time)
-    end_time = parse_time(event.end_time)
-    slots = []
-    t = datetime.datetime.combine(datetime.date.today(), start_time)
-    end_dt = datetime.datetime.combine(datetime.date.today(), end_time)
-    while t <= end_dt:
-        slots.append(t.time())
-        t += datetime.timedelta(minutes=30)
-    slot_strs = [s.strftime('%H:%M') for s in slots]
+    geometry = get_event_geometry(event)
+    dates = geometry.date_strs
+    slot_strs = geometry.slot_strs
+    report(0.1)
+    import pandas as pd
     # Build a DataFrame: rows = users, columns = date+time, value = 1 if available else 0
-    columns = []
-    for d in dates:
-        for t in slot_strs:
-            columns.append(f"{d} {t}")
+    columns = geometry.columns
     data = []
-    for user in users:
+    for n, user in enumerate(users):
         row = []
         for d in dates:
             for t in slot_strs:
                 row.append(1 if d in user_date_times[user] and t in user_date_times[user][d] else 0)
         data.append(row)
+        report(0.1 + 0.2 * (n + 1) / len(users))
     df = pd.DataFrame(data, columns=columns, index=users)
     df.index.name = 'User'
     # Write to Excel in memory
     output = io.BytesIO()
     with pd.ExcelWriter(output, engine='openpyxl') as writer:
         df.to_excel(writer, sheet_name='Availability')
-    output.seek(0)
+    return output.getvalue()
+
+@server.route('/export_availability/<event_id>')
+def export_availability(event_id):
+    session = ReadSession()
+    event = session.query(When2MeetEvent).filter_by(url=event_id).first()
+    session.close()
+    if not event:
+        return "Event not found", 404
     filename = f"when2meet_availability_{event_id}.xlsx"
-    return send_file(output, download_name=filename, as_attachment=True, mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
+    archived = 1 if event.archived_at is not None else 0
+    job = submit_job('export', f'export:{event.url}:{event.availability_version}:{archived}',
+                     {'event_url': event.url, 'filename': filename, 'versions': [[event.id, event.availability_version, bool(archived)]]})
+    if job['status'] == 'done':
+        return send_file(io.BytesIO(job['result']), download_name=filename, as_attachment=True, mimetype=_JOB_MIMETYPES['export'])
+    if job['status'] == 'failed':
+        return f"Export failed: {job['error']}", 500
+    return Response(_EXPORT_PENDING_PAGE.replace('{job_id}', json.dumps(job['id'])), status=202, mimetype='text/html')
+
+# Bulk import of the export format: rows = users, columns = "date time", value = 1 if available.
+# The whole sheet is parsed and validated as one block and loaded in a single transaction.
+class AvailabilityImportError(ValueError):
+    pass
+
+def import_availability_matrix(event, filename, content):
+    import numpy as np
+    import pandas as pd
+    started = time.perf_counter()
+    buffer = io.BytesIO(content)
+    try:
+        if filename.lower().endswith('.csv'):
+            df = pd.read_csv(buffer, index_col=0, dtype=str)
+        else:
+            df = pd.read_excel(buffer, index_col=0, dtype=str, engine='openpyxl')
+    except Exception as e:
+        raise AvailabilityImportError(f'Could not read {filename}: {e}')
+    if event.archived_at is not None:
+        raise AvailabilityImportError('This event has been archived and is read-only.')
+    geometry = get_event_geometry(event)
+    columns = pd.Index(df.columns.astype(str).str.strip())
+    unknown = columns[~columns.isin(geometry.columns)]
+    if len(unknown):
+        raise AvailabilityImportError(f"{len(unknown)} column(s) don't match this event's time slots, e.g. {', '.join(unknown[:3])}")
+    users = pd.Index(df.index.astype(str).str.strip())
+    if df.index.isna().any() or (users == '').any():
+        raise AvailabilityImportError('Every row needs a user name in the first column.')
+    if users.duplicated().any():
+        raise AvailabilityImportError(f"Duplicate user rows: {', '.join(users[users.duplicated()].unique()[:3])}")
+    # Vectorized 0/1 parse over the whole block
+    values = pd.to_numeric(pd.Series(df.to_numpy().ravel()), errors='coerce').fillna(0).to_numpy().reshape(df.shape)
+    user_idx, col_idx = np.nonzero(values > 0)
+    time_slots = columns.str.replace(' ', 'T', n=1).to_numpy()
+    user_names = users.to_numpy()
+    session = SessionLocal()
+    try:
+        # Same order as save_user_availability: participant locks, rows, version bump last
+        _lock_participants(session, event.id, user_names.tolist())
+        session.query(When2MeetAvailability).filter(
+            When2MeetAvailability.event_id == event.id,
+            When2MeetAvailability.user_name.in_(user_names.tolist())
+        ).delete(synchronize_session=False)
+        if len(user_idx):
+            _bulk_insert_slots(session, event.id, user_names[user_idx], time_slots[col_idx])
+        updated = session.query(When2MeetEvent).filter(When2MeetEvent.id == event.id, When2MeetEvent.archived_at.is_(None)).update(
+            {When2MeetEvent.availability_version: When2MeetEvent.availability_version + 1}, synchronize_session=False)
+        if not updated:
+            raise AvailabilityImportError('This event has been archived and is read-only.')
+        session.commit()
+        mark_primary_sticky()
+    finally:
+        session.close()
+    elapsed = time.perf_counter() - started
+    return {
+        'participants': len(user_names),
+        'columns': len(columns),
+        'cells': int(values.size),
+        'slots_saved': len(user_idx),
+        'seconds': round(elapsed, 3),
+        'cells_per_second': int(values.size / elapsed) if elapsed else None,
+    }
+
+def _bulk_insert_slots(session, event_id, user_names, time_slots):
+    # Load the (user, slot) arrays without building a row object per slot: COPY on Postgres, and on
+    # SQLite one executemany over the stacked array. The caller holds the participants' locks and
+    # has deleted their rows in this transaction, so nothing can conflict.
+    import numpy as np
+    import pandas as pd
+    dbapi_connection = session.connection().connection
+    cursor = dbapi_connection.cursor()
+    try:
+        if engine.dialect.name == 'postgresql':
+            buffer = io.StringIO()
+            pd.DataFrame({'event_id': event_id, 'user_name': user_names, 'time_slot': time_slots, 'available': True}).to_csv(
+                buffer, header=False, index=False)
+            buffer.seek(0)
+            cursor.copy_expert('COPY when2meet_availability (event_id, user_name, time_slot, available) FROM STDIN WITH (FORMAT csv)', buffer)
+        else:
+            cursor.executemany(
+                f'INSERT INTO when2meet_availability (event_id, user_name, time_slot, available) VALUES ({int(event_id)}, ?, ?, 1)',
+                np.column_stack((user_names, time_slots)).tolist())
+    finally:
+        cursor.close()
+
+def _format_import_result(result):
+    return (f"Imported {result['participants']} participants ({result['slots_saved']} available slots "
+            f"from {result['cells']} cells) in {result['seconds']}s.")
+
+@server.route('/import_availability/<event_id>', methods=['POST'])
+def import_availability(event_id):
+    upload = request.files.get('file')
+    if upload is None:
+        return jsonify({'error': 'Attach the spreadsheet as the "file" form field.'}), 400
+    session = SessionLocal()
+    event = session.query(When2MeetEvent).filter_by(url=event_id).first()
+    session.close()
+    if not event:
+        return jsonify({'error': 'Event not found'}), 404
+    try:
+        result = import_availability_matrix(event, upload.filename or '', upload.read())
+    except AvailabilityImportError as e:
+        return jsonify({'error': str(e)}), 400
+    return jsonify(result)
+
+@app.callback(
+    Output('grid-message', 'children', allow_duplicate=True),
+    Output('event-availability-grid', 'children', allow_duplicate=True),
+    Input('import-availability-upload', 'contents'),
+    State('import-availability-upload', 'filename'),
+    State('user-availability-store', 'data'),
+    State('event-user-store', 'data'),
+    State('url', 'pathname'),
+    prevent_initial_call=True
+)
+def import_availability_upload(contents, filename, user_avail, user_data, pathname):
+    if not contents or not pathname or '/event/' not in pathname:
+        return dash.no_update, dash.no_update
+    event_id = pathname.split('/event/')[1]
+    session = SessionLocal()
+    event = session.query(When2MeetEvent).filter_by(url=event_id).first()
+    session.close()
+    if not event:
+        return 'Event not found.', dash.no_update
+    try:
+        result = import_availability_matrix(event, filename or '', base64.b64decode(contents.split(',', 1)[1]))
+    except AvailabilityImportError as e:
+        return f'Import failed: {e}', dash.no_update
+    print(f"IMPORT: {event_id} {json.dumps(result)}")
+    # Re-read the event so the grid picks up the new availability version
+    session = SessionLocal()
+    event = session.query(When2MeetEvent).filter_by(url=event_id).first()
+    session.close()
+    user_name = user_data['username'] if user_data and user_data.get('username') else None
+    user_avail_set = set(tuple(x) for x in (user_avail or []))
+    return _format_import_result(result), render_availability_grid(event, user_avail_set, signed_in=bool(user_name), user_name=user_name)
+
+# Cross-event free/busy: one participant's picks in every event overlapping a date range are
+# merged into a single 30-minute timeline in a reference zone (tz_name). Each event's wall-clock
+# slots are read in that event's own timezone and placed by their absolute time, so each event
+# becomes a bitmask over the range (bit = half-hours since the range start) and combining events
+# is bitwise OR/AND.
+
+def _event_zone(event):
+    try:
+        return ZoneInfo(event.timezone)
+    except (ZoneInfoNotFoundError, ValueError):
+        return datetime.timezone.utc
+
+def _mask_runs(mask):
+    # Yield (first_bit, length) for each run of consecutive set bits
+    while mask:
+        start = (mask & -mask).bit_length() - 1
+        run = mask >> start
+        length = (~run & (run + 1)).bit_length() - 1
+        yield start, length
+        mask &= ~(((1 << length) - 1) << start)
+
+def get_participant_freebusy(user_name, start_date, end_date, tz_name='UTC'):
+    ref_tz = ZoneInfo(tz_name)
+    range_start = datetime.datetime.combine(start_date, datetime.time(), tzinfo=ref_tz).astimezone(datetime.timezone.utc)
+    range_end = datetime.datetime.combine(end_date + datetime.timedelta(days=1), datetime.time(), tzinfo=ref_tz).astimezone(datetime.timezone.utc)
+    num_bits = int((range_end - range_start).total_seconds() // 1800)
+    # Event dates are wall-clock dates in the event's zone; widen by a day and let the bits decide
+    query_start = datetime.datetime.combine(start_date - datetime.timedelta(days=1), datetime.time())
+    query_end = datetime.datetime.combine(end_date + datetime.timedelta(days=2), datetime.time())
+    session = ReadSession()
+    try:
+        rows = session.query(When2MeetEvent.id, When2MeetAvailability.time_slot).join(
+            When2MeetAvailability, When2MeetAvailability.event_id == When2MeetEvent.id
+        ).filter(
+            When2MeetAvailability.user_name == user_name,
+            When2MeetEvent.start_date < query_end,
+            When2MeetEvent.end_date >= query_start,
+        ).all()
+        event_ids = {event_id for event_id, _ in rows}
+        # Only the archives this participant appears in
+        archived = session.query(When2MeetEvent, When2MeetEventArchive).join(
+            When2MeetArchiveParticipant, When2MeetArchiveParticipant.event_id == When2MeetEvent.id
+        ).join(
+            When2MeetEventArchive, When2MeetEventArchive.event_id == When2MeetEvent.id
+        ).filter(
+            When2MeetArchiveParticipant.user_name == user_name,
+            When2MeetEvent.start_date < query_end,
+            When2MeetEvent.end_date >= query_start,
+        ).all()
+        events = {e.id: e for e in session.query(When2MeetEvent).filter(When2MeetEvent.id.in_(event_ids))} if event_ids else {}
+    finally:
+        session.close()
+    bits = {}
+
+    def bit_for(zone, d, t):
+        # Same wall-clock slot in the same zone -> same bit, so convert each once
+        key = (zone, d, t)
+        if key not in bits:
+            local = datetime.datetime.combine(datetime.date.fromisoformat(d), datetime.time(int(t[:2]), int(t[3:5])), tzinfo=zone)
+            bit = int((local.astimezone(datetime.timezone.utc) - range_start).total_seconds() // 1800)
+            bits[key] = bit if 0 <= bit < num_bits else None
+        return bits[key]
+
+    masks = {}
+    for event_id, time_slot in rows:
+        dt = time_slot.split('T')
+        if len(dt) != 2:
+            continue
+        bit = bit_for(_event_zone(events[event_id]), dt[0], dt[1])
+        if bit is not None:
+            masks[event_id] = masks.get(event_id, 0) | (1 << bit)
+    for event, archive in archived:
+        keys = decode_archive(archive, event).get(user_name)
+        if not keys:
+            continue
+        events[event.id] = event
+        zone = _event_zone(event)
+        for d, t in keys:
+            bit = bit_for(zone, d, t)
+            if bit is not None:
+                masks[event.id] = masks.get(event.id, 0) | (1 << bit)
+    # available: picked in any event; conflicts: picked in two or more
+    available = 0
+    conflicts = 0
+    for mask in masks.values():
+        conflicts |= available & mask
+        available |= mask
+
+    def slot_time(bit):
+        return (range_start + datetime.timedelta(minutes=30 * bit)).astimezone(ref_tz).strftime('%Y-%m-%dT%H:%M')
+
+    def interval(start, length):
+        return {'start': slot_time(start), 'end': slot_time(start + length)}
+
+    conflict_intervals = []
+    for start, length in _mask_runs(conflicts):
+        run_mask = ((1 << length) - 1) << start
+        conflict_intervals.append({
+            **interval(start, length),
+            'events': sorted(events[event_id].name for event_id, mask in masks.items() if mask & run_mask),
+        })
+    return {
+        'user_name': user_name,
+        'start_date': str(start_date),
+        'end_date': str(end_date),
+        'timezone': tz_name,
+        'events': sorted(
+            ({'name': events[event_id].name, 'url': events[event_id].url, 'slots': mask.bit_count()} for event_id, mask in masks.items()),
+            key=lambda e: e['name']
+        ),
+        'available': [interval(start, length) for start, length in _mask_runs(available)],
+        'conflicts': conflict_intervals,
+    }
+
+@server.route('/freebusy.json')
+def freebusy_json():
+    user_name = request.args.get('name', '').strip()
+    try:
+        start_date = datetime.date.fromisoformat(request.args.get('start', ''))
+        end_date = datetime.date.fromisoformat(request.args.get('end', ''))
+    except ValueError:
+        return jsonify({'error': 'start and end must be YYYY-MM-DD dates'}), 400
+    if not user_name or end_date < start_date:
+        return jsonify({'error': 'name is required and end must not be before start'}), 400
+    tz_name = request.args.get('tz', 'UTC')
+    try:
+        ZoneInfo(tz_name)
+    except (ZoneInfoNotFoundError, ValueError):
+        return jsonify({'error': f'Unknown timezone: {tz_name}'}), 400
+    return jsonify(get_participant_freebusy(user_name, start_date, end_date, tz_name))
+
+def serve_freebusy_page():
+    return html.Div([
+        html.Div([
+            html.H2('My Schedule', className='homepage-title'),
+            html.Label('Your Name:'),
+            dcc.Input(id='freebusy-name', type='text', placeholder='Name used in your events', style={'width': '100%', 'marginBottom': '8px'}),
+            html.Label('Date Range:'),
+            dcc.DatePickerRange(id='freebusy-range', style={'marginBottom': '8px'}),
+            html.Label('Show Times In:'),
+            dcc.Dropdown(id='freebusy-timezone', options=_TIMEZONE_OPTIONS, value='America/Chicago', clearable=False,
+                         style={'width': '100%', 'marginBottom': '8px', 'color': 'black'}),
+            html.Button('Show', id='freebusy-show-btn', n_clicks=0, style={
+                'width': '100%', 'fontSize': '16px', 'padding': '10px', 'background': '#E77D2E', 'color': 'white', 'border': 'none', 'borderRadius': '4px', 'cursor': 'pointer', 'marginBottom': '8px'
+            }),
+        ], style={'maxWidth': '350px', 'margin': '0 auto'}),
+        html.Div(id='freebusy-output', style={'maxWidth': '600px', 'margin': '16px auto'})
+    ])
+
+@app.callback(
+    Output('freebusy-output', 'children'),
+    Input('freebusy-show-btn', 'n_clicks'),
+    State('freebusy-name', 'value'),
+    State('freebusy-range', 'start_date'),
+    State('freebusy-range', 'end_date'),
+    State('freebusy-timezone', 'value'),
+    prevent_initial_call=True
+)
+def show_freebusy(n_clicks, user_name, start_date, end_date, tz_name='UTC'):
+    if not user_name or not start_date or not end_date:
+        return 'Please enter your name and a date range.'
+    start = datetime.date.fromisoformat(start_date[:10])
+    end = datetime.date.fromisoformat(end_date[:10])
+    result = get_participant_freebusy(user_name.strip(), start, end, tz_name or 'UTC')
+    if not result['events']:
+        return html.P('No availability found for that name in this range.', style={'color': '#aaa'})
+
+    def label(entry):
+        return f"{entry['start'].replace('T', ' ')} - {entry['end'][11:]}"
+
+    return html.Div([
+        html.P(f"Times in {result['timezone']}", style={'color': '#aaa'}),
+        html.H4('Events'),
+        html.Ul([html.Li(html.A(e['name'], href=f"/event/{e['url']}", style={'color': '#E77D2E'})) for e in result['events']]),
+        html.H4('Available'),
+        html.Ul([html.Li(label(a)) for a in result['available']]),
+        html.H4('Conflicts'),
+        html.Ul([html.Li(f"{label(c)}: {', '.join(c['events'])}") for c in result['conflicts']]) if result['conflicts']
+        else html.P('None', style={'color': '#aaa'}),
+    ])
+
+# iCalendar import: the .ics is read line by line, each VEVENT's occurrences are generated
+# lazily and only inside the event's date window, and busy time is folded straight into a set of
+# grid slots, so large multi-year exports never hold their expanded occurrences in memory.
+# Recurring VEVENTs are expanded after the whole file has been read, so that modified instances
+# (RECURRENCE-ID) can replace their original occurrence instead of adding to it.
+
+def _ics_lines(stream):
+    # Unfold continuation lines (RFC 5545 section 3.1)
+    current = None
+    for raw in stream:
+        line = raw.rstrip('\r\n')
+        if line[:1] in (' ', '\t') and current is not None:
+            current += line[1:]
+            continue
+        if current is not None:
+            yield current
+        current = line
+    if current is not None:
+        yield current
+
+def _ics_property(line):
+    name_params, _, value = line.partition(':')
+    parts = name_params.split(';')
+    params = dict(p.split('=', 1) for p in parts[1:] if '=' in p)
+    return parts[0].upper(), {k.upper(): v for k, v in params.items()}, value.strip()
+
+def _ics_datetime(value, params, default_tz):
+    # Returns (aware datetime in its own zone, is_all_day)
+    if params.get('VALUE') == 'DATE' or len(value) == 8:
+        return datetime.datetime.strptime(value[:8], '%Y%m%d').replace(tzinfo=default_tz), True
+    dt = datetime.datetime.strptime(value[:15], '%Y%m%dT%H%M%S')
+    if value.endswith('Z'):
+        return dt.replace(tzinfo=datetime.timezone.utc), False
+    tzid = params.get('TZID', '').strip('"')
+    if tzid:
+        try:
+            return dt.replace(tzinfo=ZoneInfo(tzid)), False
+        except (ZoneInfoNotFoundError, ValueError):
+            pass
+    # Floating time (or an unknown TZID): read it in the event's timezone
+    return dt.replace(tzinfo=default_tz), False
+
+def _ics_duration(value):
+    sign = -1 if value.startswith('-') else 1
+    value = value.lstrip('+-').lstrip('P')
+    days = seconds = 0
+    date_part, _, time_part = value.partition('T')
+    number = ''
+    for ch in date_part:
+        if ch.isdigit():
+            number += ch
+        else:
+            days += int(number or 0) * {'W': 7, 'D': 1}.get(ch, 0)
+            number = ''
+    for ch in time_part:
+        if ch.isdigit():
+            number += ch
+        else:
+            seconds += int(number or 0) * {'H': 3600, 'M': 60, 'S': 1}.get(ch, 0)
+            number = ''
+    return sign * datetime.timedelta(days=days, seconds=seconds)
+
+# Occurrences walked per recurring VEVENT before the calendar is rejected
+ICS_MAX_OCCURRENCES = int(os.environ.get('ICS_MAX_OCCURRENCES', '20000'))
+_ICS_PERIODS = {'HOURLY': datetime.timedelta(hours=1), 'DAILY': datetime.timedelta(days=1), 'WEEKLY': datetime.timedelta(weeks=1)}
+
+def _ics_occurrences(dtstart, rrule, exdates, window_start):
+    # Lazily yield occurrence starts from window_start on. dateutil steps in naive wall-clock
+    # time, so UNTIL and the EXDATEs are expressed in dtstart's zone first.
+    from dateutil.rrule import rrulestr
+    tz = dtstart.tzinfo
+    base = dtstart.replace(tzinfo=None)
+    naive_window_start = window_start.astimezone(tz).replace(tzinfo=None)
+    rule = {}
+    parts = []
+    for part in rrule.split(';'):
+        key, _, value = part.partition('=')
+        key = key.upper()
+        if key == 'UNTIL':
+            until, until_is_date = _ics_datetime(value, {}, tz)
+            if until_is_date:
+                until += datetime.timedelta(days=1) - datetime.timedelta(seconds=1)
+            value = until.astimezone(tz).strftime('%Y%m%dT%H%M%S')
+        rule[key] = value.upper()
+        parts.append(f'{key}={value}')
+    freq = rule.get('FREQ')
+    if freq in ('SECONDLY', 'MINUTELY'):
+        raise ValueError(f'FREQ={freq} is finer than the 30-minute grid and is not supported')
+    # Without COUNT, a fixed-period rule can start from its last period before the window instead
+    # of walking years of history (whole periods keep the weekday and time of day dtstart implies)
+    period = _ICS_PERIODS.get(freq)
+    if period is not None and 'COUNT' not in rule and base < naive_window_start:
+        step = period * max(int(rule.get('INTERVAL', '1')), 1)
+        base += step * ((naive_window_start - base) // step)
+    series = rrulestr('RRULE:' + ';'.join(parts), dtstart=base, forceset=True)
+    for exdate in exdates:
+        series.exdate(exdate.astimezone(tz).replace(tzinfo=None))
+    for walked, naive in enumerate(series):
+        if walked >= ICS_MAX_OCCURRENCES:
+            raise ValueError(f'a recurring event has more than {ICS_MAX_OCCURRENCES} occurrences to expand')
+        if naive >= naive_window_start:
+            yield naive.replace(tzinfo=tz)
+
+def _mark_busy(busy, start, end, geometry, tz, slot_minutes):
+    start = start.astimezone(tz).replace(tzinfo=None)
+    end = end.astimezone(tz).replace(tzinfo=None)
+    day = start.date()
+    while day <= end.date():
+        d = str(day)
+        if d in geometry.date_index:
+            midnight = datetime.datetime.combine(day, datetime.time())
+            for t, minutes in slot_minutes:
+                slot_start = midnight + datetime.timedelta(minutes=minutes)
+                if slot_start < end and slot_start + datetime.timedelta(minutes=30) > start:
+                    busy.add((d, t))
+        day += datetime.timedelta(days=1)
+
+def ics_busy_slots(stream, event):
+    geometry = get_event_geometry(event)
+    try:
+        tz = ZoneInfo(event.timezone)
+    except (ZoneInfoNotFoundError, ValueError):
+        tz = datetime.timezone.utc
+    window_start = datetime.datetime.combine(geometry.dates[0], datetime.time()).replace(tzinfo=tz)
+    window_end = datetime.datetime.combine(geometry.dates[-1] + datetime.timedelta(days=1), datetime.time()).replace(tzinfo=tz)
+    slot_minutes = [(t, s.hour * 60 + s.minute) for t, s in zip(geometry.slot_strs, geometry.slots)]
+    busy = set()
+    series = []     # (props, exdates) of recurring VEVENTs
+    overrides = {}  # UID -> original starts of instances replaced by a RECURRENCE-ID VEVENT
+    props = None
+    exdates = set()
+    depth = 0
+    for line in _ics_lines(stream):
+        upper = line.upper()
+        if upper == 'BEGIN:VEVENT' and props is None:
+            props, exdates, depth = {}, set(), 0
+            continue
+        if props is None:
+            continue
+        if upper.startswith('BEGIN:'):
+            depth += 1  # e.g. VALARM inside the VEVENT
+            continue
+        if upper.startswith('END:'):
+            if depth:
+                depth -= 1
+                continue
+            # END:VEVENT
+            if 'RRULE' in props:
+                series.append((props, exdates))
+            else:
+                if 'RECURRENCE-ID' in props and 'UID' in props:
+                    params, value = props['RECURRENCE-ID']
+                    overrides.setdefault(props['UID'][1], set()).add(_ics_datetime(value, params, tz)[0])
+                _expand_vevent(props, exdates, busy, geometry, tz, window_start, window_end, slot_minutes)
+            props = None
+            continue
+        if depth:
+            continue
+        name, params, value = _ics_property(line)
+        if name == 'EXDATE':
+            for part in value.split(','):
+                if part:
+                    exdates.add(_ics_datetime(part, params, tz)[0])
+        elif name not in props:
+            props[name] = (params, value)
+    for props, exdates in series:
+        exdates |= overrides.get(props.get('UID', ({}, None))[1], set())
+        _expand_vevent(props, exdates, busy, geometry, tz, window_start, window_end, slot_minutes)
+    return busy
+
+def _expand_vevent(props, exdates, busy, geometry, tz, window_start, window_end, slot_minutes):
+    if 'DTSTART' not in props:
+        return
+    if props.get('TRANSP', ({}, ''))[1].upper() == 'TRANSPARENT' or props.get('STATUS', ({}, ''))[1].upper() == 'CANCELLED':
+        return
+    dtstart, all_day = _ics_datetime(props['DTSTART'][1], props['DTSTART'][0], tz)
+    if 'DTEND' in props:
+        duration = _ics_datetime(props['DTEND'][1], props['DTEND'][0], tz)[0] - dtstart
+    elif 'DURATION' in props:
+        duration = _ics_duration(props['DURATION'][1])
+    else:
+        duration = datetime.timedelta(days=1) if all_day else datetime.timedelta(0)
+    if duration <= datetime.timedelta(0):
+        return
+    occurrences = _ics_occurrences(dtstart, props['RRULE'][1], exdates, window_start - duration) if 'RRULE' in props else iter([dtstart])
+    for start in occurrences:
+        if start >= window_end:
+            break
+        if start + duration <= window_start or start in exdates:
+            continue
+        _mark_busy(busy, start, start + duration, geometry, tz, slot_minutes)
+
+def ics_available_slots(stream, event):
+    geometry = get_event_geometry(event)
+    busy = ics_busy_slots(stream, event)
+    return [key for d in geometry.date_strs for key in geometry.col_keys[d] if key not in busy]
+
+@server.route('/import_ics/<event_id>', methods=['POST'])
+def import_ics(event_id):
+    upload = request.files.get('file')
+    if upload is None:
+        return jsonify({'error': 'Attach the calendar as the "file" form field.'}), 400
+    session = ReadSession()
+    event = session.query(When2MeetEvent).filter_by(url=event_id).first()
+    session.close()
+    if not event:
+        return jsonify({'error': 'Event not found'}), 404
+    # Parse straight from the upload stream
+    try:
+        available = ics_available_slots(io.TextIOWrapper(upload.stream, encoding='utf-8', errors='replace'), event)
+    except (ValueError, KeyError) as e:
+        return jsonify({'error': f'Could not read that calendar: {e}'}), 400
+    return jsonify({'available': available})
+
+@app.callback(
+    Output('user-availability-store', 'data', allow_duplicate=True),
+    Output('event-signin-output', 'children', allow_duplicate=True),
+    Input('ics-upload', 'contents'),
+    State('event-user-store', 'data'),
+    State('url', 'pathname'),
+    prevent_initial_call=True
+)
+def prefill_from_ics(contents, user_data, pathname):
+    if not contents or not pathname or '/event/' not in pathname:
+        return dash.no_update, dash.no_update
+    if not user_data or not user_data.get('username'):
+        return dash.no_update, 'Sign in first, then upload your calendar.'
+    event_id = pathname.split('/event/')[1]
+    session = ReadSession()
+    event = session.query(When2MeetEvent).filter_by(url=event_id).first()
+    session.close()
+    if not event:
+        return dash.no_update, 'Event not found.'
+    stream = io.TextIOWrapper(io.BytesIO(base64.b64decode(contents.split(',', 1)[1])), encoding='utf-8', errors='replace')
+    try:
+        available = ics_available_slots(stream, event)
+    except (ValueError, KeyError) as e:
+        return dash.no_update, f'Could not read that calendar: {e}'
+    return available, f'Filled from your calendar: {len(available)} free slots. Review and click Save My Availability.'
+
+# Read-only snapshot: plain server-rendered HTML of an event's heatmap for viewers and link
+# previews. It is built from the slot aggregates, cached per (event, availability_version) and
+# served with a weak ETag on that version, so repeat views are 304s and no Dash callbacks run.
+# The tag is weak because the body is br/gzip/identity encoded per request after this handler:
+# the representations are equivalent but not byte-identical, so a strong tag would be wrong.
+SNAPSHOT_MAX_AGE = int(os.environ.get('SNAPSHOT_MAX_AGE', '60'))
+SNAPSHOT_CACHE_SIZE = 128
+_snapshot_cache = collections.OrderedDict()
+_snapshot_cache_lock = threading.Lock()
+
+def render_event_snapshot(event):
+    geometry = get_event_geometry(event)
+    counts, names = get_event_aggregates(event)
+    max_count = max(counts.values(), default=1)
+    participants = len({n for slot_names in names.values() for n in slot_names})
+    title = escape(event.name)
+    description = escape(f"{participants} participant(s), {event.start_date.date()} to {event.end_date.date()}, {event.start_time}-{event.end_time} {event.timezone}")
+    rows = []
+    for slot_str, (slot_label, _) in zip(geometry.slot_strs, geometry.slot_labels):
+        cells = [f'<th>{escape(slot_label)}</th>']
+        for date_str in geometry.date_strs:
+            key = (date_str, slot_str)
+            count = counts.get(key, 0)
+            who = escape(', '.join(names.get(key, [])) or 'None')
+            cells.append(f'<td style="background:{heat_color(count, max_count)}" title="{who}">{count}</td>')
+        rows.append(f"<tr>{''.join(cells)}</tr>")
+    header = ''.join(f'<th>{escape(day)}<br><small>{escape(month)}</small></th>' for day, month, _ in geometry.date_labels)
+    archived_note = '<p class="note">This event has ended and been archived.</p>' if event.archived_at is not None else ''
+    return f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{title} - 7525 When2Meet</title>
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<meta property="og:title" content="{title}"><meta property="og:description" content="{description}">
+<meta name="description" content="{description}">
+<style>body{{background:#1a1a1a;color:#f5f5f5;font-family:sans-serif;text-align:center}}table{{border-collapse:collapse;margin:0 auto}}
+td{{width:40px;height:28px;border:1px solid #ccc;color:#000;font-weight:bold;font-size:13px}}th{{padding:2px 6px;font-size:12px}}
+a{{color:#E77D2E}}.note{{color:#E77D2E}}</style></head>
+<body><h2>{title}</h2><p>{description}</p>{archived_note}
+<table><thead><tr><th></th>{header}</tr></thead><tbody>{''.join(rows)}</tbody></table>
+<p><a href="/event/{escape(event.url)}">Open the event to add your availability</a></p></body></html>"""
+
+@server.route('/snapshot/<event_id>')
+def event_snapshot(event_id):
+    session = ReadSession()
+    event = session.query(When2MeetEvent).filter_by(url=event_id).first()
+    session.close()
+    if not event:
+        return "Event not found", 404
+    version = (event.id, event.availability_version or 0, event.archived_at is not None)
+    etag = 'w2m-{}-{}-{:d}'.format(*version)
+    response = Response(mimetype='text/html')
+    response.set_etag(etag, weak=True)
+    response.vary.add('Accept-Encoding')
+    response.cache_control.public = True
+    response.cache_control.max_age = SNAPSHOT_MAX_AGE
+    if request.if_none_match.contains_weak(etag):
+        response.status_code = 304
+        return response
+    with _snapshot_cache_lock:
+        body = _snapshot_cache.get(version)
+    if body is None:
+        body = render_event_snapshot(event)
+        with _snapshot_cache_lock:
+            _snapshot_cache[version] = body
+            while len(_snapshot_cache) > SNAPSHOT_CACHE_SIZE:
+                _snapshot_cache.popitem(last=False)
+    response.set_data(body)
+    return response
+
+# Event retention: events whose end_date is more than ARCHIVE_AFTER_DAYS in the past are folded
+# into a single When2MeetEventArchive row, then their availability rows are deleted in small
+# batches so each transaction holds its locks briefly. Archived events stay viewable read-only.
+ARCHIVE_AFTER_DAYS = os.environ.get('ARCHIVE_AFTER_DAYS')
+ARCHIVE_INTERVAL_SECONDS = int(os.environ.get('ARCHIVE_INTERVAL_SECONDS', '3600'))
+ARCHIVE_EVENTS_PER_RUN = int(os.environ.get('ARCHIVE_EVENTS_PER_RUN', '20'))
+ARCHIVE_DELETE_BATCH = int(os.environ.get('ARCHIVE_DELETE_BATCH', '1000'))
+
+def load_archived_user_slots(event, session=None):
+    if session is not None:
+        archive = session.get(When2MeetEventArchive, event.id)
+    else:
+        session = ReadSession()
+        archive = session.get(When2MeetEventArchive, event.id)
+        session.close()
+    if archive is None:
+        return {}
+    return decode_archive(archive, event)
+
+def decode_archive(archive, event):
+    geometry = get_event_geometry(event)
+    users = json.loads(zlib.decompress(archive.payload))['users']
+    return {user_name: geometry.unpack(int(mask, 16)) for user_name, mask in users.items()}
+
+def archived_user_date_times(event, session=None):
+    user_date_times = {}
+    for user_name, keys in load_archived_user_slots(event, session).items():
+        for d, t in keys:
+            user_date_times.setdefault(user_name, {}).setdefault(d, set()).add(t)
+    return user_date_times
+
+def archived_slot_aggregates(event):
+    names = {}
+    for user_name, keys in load_archived_user_slots(event).items():
+        for key in keys:
+            names.setdefault(key, []).append(user_name)
+    names = {key: sorted(slot_names) for key, slot_names in names.items()}
+    return {key: len(slot_names) for key, slot_names in names.items()}, names
+
+def archive_event(event_id):
+    session = SessionLocal()
+    try:
+        # Row lock so two workers never archive the same event (no-op on SQLite, where writes are serialized)
+        event = session.query(When2MeetEvent).filter(
+            When2MeetEvent.id == event_id, When2MeetEvent.archived_at.is_(None)
+        ).with_for_update(skip_locked=True).first()
+        if not event:
+            return False
+        geometry = get_event_geometry(event)
+        user_keys = {}
+        slot_count = 0
+        for user_name, time_slot in session.query(When2MeetAvailability.user_name, When2MeetAvailability.time_slot).filter_by(event_id=event.id):
+            dt = time_slot.split('T')
+            if len(dt) == 2:
+                user_keys.setdefault(user_name, []).append((dt[0], dt[1]))
+                slot_count += 1
+        users = {user_name: format(geometry.pack(keys), 'x') for user_name, keys in user_keys.items()}
+        payload = zlib.compress(json.dumps({'users': users}, separators=(',', ':')).encode(), 9)
+        now = datetime.datetime.now()
+        session.add(When2MeetEventArchive(event_id=event.id, archived_at=now, participants=len(users), slot_count=slot_count, payload=payload))
+        session.flush()  # the archive row must exist before its participant rows
+        session.add_all([When2MeetArchiveParticipant(event_id=event.id, user_name=user_name) for user_name in users])
+        event.archived_at = now
+        session.commit()
+    except Exception as e:
+        session.rollback()
+        print(f"ARCHIVE: could not archive event {event_id}: {e}")
+        return False
+    finally:
+        session.close()
+    purge_event_availability(event_id)
+    return True
+
+def purge_event_availability(event_id):
+    deleted = 0
+    while True:
+        session = SessionLocal()
+        try:
+            ids = [r[0] for r in session.query(When2MeetAvailability.id).filter_by(event_id=event_id).limit(ARCHIVE_DELETE_BATCH)]
+            if not ids:
+                return deleted
+            session.query(When2MeetAvailability).filter(When2MeetAvailability.id.in_(ids)).delete(synchronize_session=False)
+            session.commit()
+            deleted += len(ids)
+        finally:
+            session.close()
+
+def archive_expired_events(after_days, limit=ARCHIVE_EVENTS_PER_RUN):
+    # end_date is the start of the event's last day
+    cutoff = datetime.datetime.now() - datetime.timedelta(days=after_days + 1)
+    session = SessionLocal()
+    try:
+        expired_ids = [r[0] for r in session.query(When2MeetEvent.id).filter(
+            When2MeetEvent.end_date < cutoff, When2MeetEvent.archived_at.is_(None)
+        ).order_by(When2MeetEvent.end_date).limit(limit)]
+        # Events archived by a run that stopped before its purge finished
+        leftover_ids = [r[0] for r in session.query(When2MeetAvailability.event_id).join(When2MeetEvent).filter(
+            When2MeetEvent.archived_at.isnot(None)
+        ).distinct().limit(limit)]
+    finally:
+        session.close()
+    archived = sum(1 for event_id in expired_ids if archive_event(event_id))
+    for event_id in leftover_ids:
+        purge_event_availability(event_id)
+    return archived
+
+def _archive_loop():
+    while True:
+        try:
+            ensure_schema()
+            started = time.perf_counter()
+            archived = archive_expired_events(float(ARCHIVE_AFTER_DAYS))
+            if archived:
+                print(f"ARCHIVE: archived {archived} event(s) in {time.perf_counter() - started:.2f}s")
+        except Exception as e:
+            print(f"ARCHIVE: run failed: {e}")
+        time.sleep(ARCHIVE_INTERVAL_SECONDS)
+
+_record_startup_metrics(import_ms=round((time.perf_counter() - _IMPORT_STARTED) * 1000, 1))
+threading.Thread(target=_warm_start, name='warm-start', daemon=True).start()
+if ARCHIVE_AFTER_DAYS:
+    threading.Thread(target=_archive_loop, name='archive', daemon=True).start()
 
 if __name__ == '__main__':
     app.run(debug=False)
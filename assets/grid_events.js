@@ -0,0 +1,49 @@
+// Delegated listener for the availability grid.
+// One click/mouseover handler on the document finds the nearest element tagged with
+// data-grid-kind and reports only its coordinates to grid-click-store / grid-hover-store,
+// so callbacks receive a constant-size payload however large the grid is.
+(function () {
+    var clickSeq = 0;
+    var lastHover = null;
+
+    function gridTarget(el) {
+        return el && el.closest ? el.closest('[data-grid-kind]') : null;
+    }
+
+    function setStore(storeId, data) {
+        if (!window.dash_clientside || !window.dash_clientside.set_props) {
+            return;
+        }
+        if (!document.getElementById(storeId)) {
+            return;
+        }
+        window.dash_clientside.set_props(storeId, {data: data});
+    }
+
+    document.addEventListener('click', function (e) {
+        var target = gridTarget(e.target);
+        if (!target) {
+            return;
+        }
+        // seq makes repeated clicks on the same cell register as a change
+        clickSeq += 1;
+        setStore('grid-click-store', {
+            kind: target.dataset.gridKind,
+            date: target.dataset.date || null,
+            time: target.dataset.time || null,
+            seq: clickSeq
+        });
+    });
+
+    document.addEventListener('mouseover', function (e) {
+        var target = gridTarget(e.target);
+        var cell = target && target.dataset.gridKind === 'cell' ? target : null;
+        var key = cell ? cell.dataset.date + 'T' + cell.dataset.time : null;
+        // Only report when the hovered cell changes
+        if (key === lastHover) {
+            return;
+        }
+        lastHover = key;
+        setStore('grid-hover-store', cell ? {date: cell.dataset.date, time: cell.dataset.time} : null);
+    });
+})();
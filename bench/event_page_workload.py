@@ -0,0 +1,82 @@
+"""Event-page workload against whatever DATABASE_URL points at.
+
+N processes (like the gunicorn workers) each load the event and its slot aggregates per op and
+save their own availability every 10th op. Runs once with the per-worker aggregate cache off and
+once with it on, and prints the average latency per op and any errors.
+
+    DATABASE_URL=postgresql://... python bench/event_page_workload.py
+    W2M_EMBEDDED=1 SQLITE_PATH=/tmp/bench.db python bench/event_page_workload.py
+"""
+import argparse
+import datetime
+import multiprocessing as mp
+import os
+import sys
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def setup(users):
+    import app
+    app.ensure_schema()
+    session = app.SessionLocal()
+    event = app.When2MeetEvent(name='Bench', url=f'bench-{uuid.uuid4().hex[:12]}', timezone='UTC',
+                               start_date=datetime.datetime(2025, 1, 1), end_date=datetime.datetime(2025, 1, 7),
+                               start_time='09:00', end_time='18:00')
+    session.add(event)
+    session.commit()
+    geometry = app.get_event_geometry(event)
+    rows = [
+        {'event_id': event.id, 'user_name': f'u{u}', 'time_slot': f'{d}T{t}', 'available': True}
+        for u in range(users) for d in geometry.date_strs for t in geometry.slot_strs
+        if (u + int(t[:2]) + int(t[3:])) % 2
+    ]
+    session.execute(app.insert(app.When2MeetAvailability), rows)
+    session.commit()
+    url = event.url
+    session.close()
+    return url, len(rows)
+
+
+def worker(args):
+    worker_id, url, ops, use_cache = args
+    import app
+    if not use_cache:
+        app.AGGREGATE_CACHE_SIZE = 0
+    picks = [['2025-01-02', '10:00'], ['2025-01-03', '11:00']]
+    errors = 0
+    started = time.perf_counter()
+    for i in range(ops):
+        try:
+            if i % 10 == 0:
+                app.save_user_availability(1, picks[:(i // 10) % 2 + 1], {'username': f'w{worker_id}'}, f'/event/{url}')
+            session = app.SessionLocal()
+            event = session.query(app.When2MeetEvent).filter_by(url=url).first()
+            session.close()
+            app.get_event_aggregates(event)
+        except Exception as e:
+            errors += 1
+            print(f'worker {worker_id}: {e}')
+    return errors, (time.perf_counter() - started) / ops * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--processes', type=int, default=3)
+    parser.add_argument('--ops', type=int, default=100)
+    parser.add_argument('--users', type=int, default=50)
+    args = parser.parse_args()
+    mp.set_start_method('spawn', force=True)
+    for use_cache in (False, True):
+        with mp.Pool(1) as pool:
+            url, rows = pool.apply(setup, (args.users,))
+        with mp.Pool(args.processes) as pool:
+            results = pool.map(worker, [(i, url, args.ops, use_cache) for i in range(args.processes)])
+        print(f"{'cache' if use_cache else 'no cache'}: {args.processes} processes x {args.ops} ops, {rows} rows, "
+              f"{sum(r[1] for r in results) / len(results):.1f} ms/op, {sum(r[0] for r in results)} errors")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+"""Concurrent availability saves against whatever DATABASE_URL points at.
+
+N processes (like the gunicorn workers) save availability for one event as fast as they can.
+Every other save goes to a name shared by all processes, the rest to a name shared by a few, so
+the same participant is written from several processes at once. Afterwards it checks that no
+(event, participant, slot) row is duplicated, that every participant ended with one of the sets
+that was actually submitted, and that the event version counted every save, then prints the
+throughput. Exits non-zero if a check fails.
+
+    DATABASE_URL=postgresql://... python bench/stress_saves.py --processes 8
+    W2M_EMBEDDED=1 SQLITE_PATH=/tmp/stress.db python bench/stress_saves.py
+"""
+import argparse
+import contextlib
+import datetime
+import io
+import multiprocessing as mp
+import os
+import random
+import sys
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+SLOT_SETS = [
+    [['2099-01-01', f'{h:02d}:{m}'] for h in range(9, 18) for m in ('00', '30') if (h + len(m) + k) % 3]
+    for k in range(3)
+]
+
+
+def setup():
+    import app
+    app.ensure_schema()
+    session = app.SessionLocal()
+    event = app.When2MeetEvent(name='Stress', url=f'stress-{uuid.uuid4().hex[:12]}', timezone='UTC',
+                               start_date=datetime.datetime(2099, 1, 1), end_date=datetime.datetime(2099, 1, 1),
+                               start_time='09:00', end_time='18:00')
+    session.add(event)
+    session.commit()
+    event_id, url = event.id, event.url
+    session.close()
+    return event_id, url
+
+
+def worker(args):
+    worker_id, url, saves = args
+    import app
+    rnd = random.Random(worker_id)
+    done = errors = 0
+    started = time.perf_counter()
+    for i in range(saves):
+        user_name = 'shared' if i % 2 else f'group{worker_id % 4}'
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                app.save_user_availability(1, rnd.choice(SLOT_SETS), {'username': user_name}, f'/event/{url}')
+            done += 1
+        except Exception as e:
+            errors += 1
+            print(f'worker {worker_id}: {e}')
+    return done, errors, time.perf_counter() - started
+
+
+def check(event_id):
+    import app
+    from sqlalchemy import func
+    session = app.SessionLocal()
+    try:
+        A = app.When2MeetAvailability
+        duplicates = session.query(A.user_name, A.time_slot).filter(A.event_id == event_id).group_by(
+            A.user_name, A.time_slot).having(func.count(A.id) > 1).count()
+        final = {}
+        for user_name, time_slot in session.query(A.user_name, A.time_slot).filter(A.event_id == event_id):
+            final.setdefault(user_name, set()).add(time_slot)
+        version = session.query(app.When2MeetEvent.availability_version).filter_by(id=event_id).scalar()
+    finally:
+        session.close()
+    submitted = [{f'{d}T{t}' for d, t in slots} for slots in SLOT_SETS]
+    return duplicates, all(slots in submitted for slots in final.values()), version
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--processes', type=int, default=8)
+    parser.add_argument('--saves', type=int, default=60, help='saves per process')
+    args = parser.parse_args()
+    mp.set_start_method('spawn', force=True)
+    with mp.Pool(1) as pool:
+        event_id, url = pool.apply(setup)
+    with mp.Pool(args.processes) as pool:
+        results = pool.map(worker, [(i, url, args.saves) for i in range(args.processes)])
+    with mp.Pool(1) as pool:
+        duplicates, sets_valid, version = pool.apply(check, (event_id,))
+    saves = sum(r[0] for r in results)
+    errors = sum(r[1] for r in results)
+    wall = max(r[2] for r in results)
+    print(f'{saves} saves, {errors} errors, {duplicates} duplicate rows, final sets valid: {sets_valid}, '
+          f'version {version}, {saves / wall:.0f} saves/s across {args.processes} processes')
+    if errors or duplicates or not sets_valid or version != saves:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()